@@ -13,11 +13,11 @@ Code generation:
 
 from qiskit import QuantumCircuit, transpile
 from qiskit_aer.primitives import Estimator
-from qiskit_aer import AerSimulator
 from scipy.optimize import minimize
 import numpy as np
 
 from algorithms.hamiltonian import build_ising_hamiltonian
+from simulation import get_counts_simulator, get_sv_simulator
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -119,7 +119,7 @@ def run_qaoa(
     opt_circuit = build_qaoa_circuit(num_qubits, interaction_matrix, opt_gammas, opt_betas, linear_terms)
 
     # Statevector
-    sim_sv = AerSimulator(method="statevector")
+    sim_sv = get_sv_simulator(num_qubits)
     sv_qc = opt_circuit.copy()
     sv_qc.save_statevector()
     sv_result = sim_sv.run(transpile(sv_qc, sim_sv)).result()
@@ -129,7 +129,7 @@ def run_qaoa(
     # Counts
     meas_qc = opt_circuit.copy()
     meas_qc.measure_all()
-    sim_qasm = AerSimulator()
+    sim_qasm = get_counts_simulator()
     meas_result = sim_qasm.run(transpile(meas_qc, sim_qasm), shots=shots).result()
     counts = meas_result.get_counts(meas_qc)
     most_likely = max(counts, key=counts.get)
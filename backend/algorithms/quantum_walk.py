@@ -15,11 +15,12 @@ Code generation:
 
 from qiskit import QuantumCircuit, transpile
 from qiskit.quantum_info import Operator
-from qiskit_aer import AerSimulator
 from scipy.linalg import expm
 import numpy as np
 import math
 
+from simulation import get_counts_simulator
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 #  Graph generators
@@ -141,7 +142,7 @@ def run_quantum_walk(
     qc.unitary(Operator(U_final), range(num_qubits), label=f"Walk(t={final_t})")
     qc.measure_all()
 
-    sim = AerSimulator()
+    sim = get_counts_simulator()
     compiled = transpile(qc, sim)
     result = sim.run(compiled, shots=shots).result()
     counts = result.get_counts(qc)
@@ -18,11 +18,11 @@ Code generation:
 from qiskit import QuantumCircuit, transpile
 from qiskit.circuit import Parameter
 from qiskit_aer.primitives import Estimator
-from qiskit_aer import AerSimulator
 from scipy.optimize import minimize
 import numpy as np
 
 from algorithms.hamiltonian import parse_hamiltonian, bases_scales_to_hamiltonian
+from simulation import get_counts_simulator, get_sv_simulator
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -123,7 +123,7 @@ def run_vqe(
     bound_qc = ansatz.assign_parameters(dict(zip(parameters, result.x)))
 
     # Statevector
-    sim_sv = AerSimulator(method="statevector")
+    sim_sv = get_sv_simulator(num_qubits)
     sv_qc = bound_qc.copy()
     sv_qc.save_statevector()
     sv_compiled = transpile(sv_qc, sim_sv)
@@ -134,7 +134,7 @@ def run_vqe(
     # Counts
     meas_qc = bound_qc.copy()
     meas_qc.measure_all()
-    sim_qasm = AerSimulator()
+    sim_qasm = get_counts_simulator()
     meas_compiled = transpile(meas_qc, sim_qasm)
     meas_result = sim_qasm.run(meas_compiled, shots=shots).result()
     counts = meas_result.get_counts(meas_qc)
@@ -165,8 +165,8 @@ def build_ansatz(circuit_data, num_qubits: int):
     qc = QuantumCircuit(num_qubits)
     params: list[Parameter] = []
     for i, gate in enumerate(circuit_data.gates):
-        name = gate.name.upper()
-        qubits = gate.qubits
+        name = gate["name"].upper()
+        qubits = gate["qubits"]
         if name == "H": qc.h(qubits[0])
         elif name == "X": qc.x(qubits[0])
         elif name == "Y": qc.y(qubits[0])
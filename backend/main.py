@@ -9,12 +9,36 @@ Exposes RESTful endpoints for:
   • Quantum Fourier Transform (QFT) construction and simulation.
 """
 
-from fastapi import FastAPI, HTTPException
+import asyncio
+import base64
+import functools
+import logging
+import logging.handlers
+import multiprocessing
+import os
+import queue
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from io import BytesIO
+from typing import Optional
+
+import matplotlib
+matplotlib.use("Agg")  # Non-interactive backend for server-side rendering
+import matplotlib.pyplot as plt
+
+from fastapi import Depends, FastAPI, HTTPException, Query, Request
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response
+from fastapi.routing import APIRoute
+import numpy as np
+from pydantic import BaseModel, ValidationError
+from qiskit import QuantumCircuit
 
 from models import (
     CircuitRequest,
     ExecutionResult,
+    OptimizationResult,
     AlgorithmRequest,
     AlgorithmResponse,
     VQERequest,
@@ -25,15 +49,18 @@ from models import (
     QAOAResponse,
     QuantumWalkRequest,
     QuantumWalkResponse,
+    rebuild_models,
 )
 from simulation import (
     build_circuit,
-    run_circuit,
+    run_qc,
     get_statevector,
-    get_bloch_image,
+    simulate_statevector,
+    get_bloch_image_async,
     build_qft_circuit,
 )
 from optimization import optimize_circuit
+from result_cache import ResultCache
 from algorithms import (
     run_optimization, run_vqe, generate_vqe_code,
     generate_maxcut_code, maxcut_hamiltonian_from_adjacency,
@@ -43,21 +70,235 @@ from algorithms import (
 from algorithms.qaoa import build_qaoa_circuit
 from algorithms.vqe import build_vqe_ansatz
 
-import traceback
+# Compile the deferred model schemas now, before any route is declared:
+# FastAPI wraps each body / response model in its own TypeAdapter, and for
+# a still-deferred model that adapter would only be built (with a pydantic
+# warning) on the route's first request.
+rebuild_models()
+
+# Statevectors above this size are never returned (2^N complex amplitudes)
+MAX_SV_QUBITS = 25
+
+# Disk caches for optimiser results (repeat problems skip the full loop)
+_vqe_cache = ResultCache("vqe")
+_qaoa_cache = ResultCache("qaoa")
+
+# ---------------------------------------------------------------------------
+# Logging
+# ---------------------------------------------------------------------------
+# Records are pushed onto a queue by the request thread, unformatted, and
+# formatted (tracebacks included) and written to stderr by a background
+# QueueListener, so handlers pay neither for formatting nor for I/O.
+# Set ``LOG_LEVEL=ERROR`` (or higher) in production to drop warnings.
+
+logger = logging.getLogger("qcd")
+logger.setLevel(os.environ.get("LOG_LEVEL", "INFO").upper())
+logger.propagate = False
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that enqueues records as-is, leaving formatting to the listener."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The stock prepare() merges args and renders exc_info on the calling
+        # thread (so records can be pickled); this queue never leaves the
+        # process, so the listener's formatter can do it instead.
+        return record
+
+
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_stream = logging.StreamHandler()
+_log_stream.setFormatter(
+    logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+)
+logger.addHandler(_DeferredQueueHandler(_log_queue))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_stream)
+
+
+class LoggedRoute(APIRoute):
+    """
+    Route class that turns unexpected handler exceptions into HTTP 500s.
+
+    ``HTTPException`` and request-validation errors pass through untouched;
+    anything else is logged (with traceback) and re-raised as
+    ``HTTPException(500, detail=str(e))``.  Doing this at the route level
+    rather than via ``@app.exception_handler(Exception)`` keeps the error
+    response inside ``CORSMiddleware``, so the frontend can still read it.
+    """
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+
+        async def logged_handler(request: Request):
+            try:
+                return await handler(request)
+            except (HTTPException, RequestValidationError):
+                raise
+            except Exception as e:
+                logger.exception("handler %s failed", request.url.path)
+                raise HTTPException(status_code=500, detail=str(e))
+
+        return logged_handler
+
+
+def json_body(model: type[BaseModel]):
+    """
+    Dependency that validates the raw request body straight into *model*.
+
+    ``model_validate_json`` runs pydantic-core's JSON validator on the bytes,
+    skipping the intermediate ``dict`` FastAPI would otherwise build.  Errors
+    are re-raised as ``RequestValidationError`` so clients still get the
+    standard 422 payload.  Pair with ``openapi_extra=body_schema(model)`` so
+    the body still appears in the OpenAPI docs.
+    """
+
+    async def parse(request: Request):
+        try:
+            return model.model_validate_json(await request.body())
+        except ValidationError as e:
+            raise RequestValidationError(
+                [
+                    {**err, "loc": ("body", *err["loc"])}
+                    for err in e.errors(include_url=False)
+                ]
+            )
+
+    return Depends(parse)
+
+
+def body_schema(model: type[BaseModel]) -> dict:
+    """OpenAPI ``requestBody`` entry for a route using :func:`json_body`."""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {"$ref": f"#/components/schemas/{model.__name__}"}
+                }
+            },
+        }
+    }
+
+
+# Circuit-definition body shared by the execute / optimise / export routes
+CIRCUIT_BODY = json_body(CircuitRequest)
+CIRCUIT_BODY_DOC = body_schema(CircuitRequest)
+
+CODE_FRAMEWORKS = ("qiskit", "pennylane", "cirq", "qsharp", "qasm")
+
+
+def codegen_frameworks(
+    codegen: Optional[str] = Query(
+        None,
+        description="Comma-separated frameworks to export code for "
+        "(default: all of " + ", ".join(CODE_FRAMEWORKS) + ").",
+    ),
+) -> tuple[str, ...]:
+    """
+    Dependency resolving the ``?codegen=`` query parameter.
+
+    Each framework's generator builds a full source listing, so routes only
+    run the ones the client asked for.  Unknown names are a 400.
+    """
+    if codegen is None:
+        return CODE_FRAMEWORKS
+    wanted = {fw.strip().lower() for fw in codegen.split(",") if fw.strip()}
+    unknown = wanted.difference(CODE_FRAMEWORKS)
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown codegen framework(s): {', '.join(sorted(unknown))}.",
+        )
+    return tuple(fw for fw in CODE_FRAMEWORKS if fw in wanted)
+
+
+# ---------------------------------------------------------------------------
+# Process pool for CPU-bound work
+# ---------------------------------------------------------------------------
+# VQE / QAOA alternate SciPy optimiser steps (GIL-bound) with Aer runs, and
+# the level-3 transpiler is largely pure-Python passes, so threads cannot
+# run several of them in parallel.  They are dispatched to a pool of worker
+# processes instead; ``max_workers`` bounds how many run at once and further
+# jobs queue inside the executor.  Workers are started via ``forkserver``
+# (Aer's OpenMP runtime is not fork-safe once it has been used in the
+# parent) with the algorithm and simulation modules preloaded, or via
+# ``spawn`` where forkserver is unavailable (Windows).
+#
+# Bloch rendering for wide circuits (matplotlib, also GIL-bound) gets a
+# separate, small pool (at most ``_RENDER_POOL_SIZE`` workers), so an image
+# request never queues behind a long optimiser run.
+
+_RENDER_POOL_SIZE = 4
+
+_process_pool: ProcessPoolExecutor | None = None
+_render_pool: ProcessPoolExecutor | None = None
+
+
+def _mp_context() -> multiprocessing.context.BaseContext:
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("spawn")
+    ctx = multiprocessing.get_context("forkserver")
+    ctx.set_forkserver_preload(["algorithms", "optimization", "simulation"])
+    return ctx
+
+
+def _start_process_pool() -> ProcessPoolExecutor:
+    ctx = _mp_context()
+    # Workers fork from one preloaded server and would all inherit the same
+    # np.random state; reseed each from OS entropy so concurrent optimiser
+    # runs start from different random initial points.
+    return ProcessPoolExecutor(
+        max_workers=os.cpu_count(), mp_context=ctx, initializer=np.random.seed
+    )
+
+
+def _start_render_pool() -> ProcessPoolExecutor:
+    # Same context (and preload list) as _start_process_pool: there is only
+    # one forkserver per process.  Kept small so the two pools together do
+    # not oversubscribe the cores, e.g. under several uvicorn workers.
+    return ProcessPoolExecutor(
+        max_workers=min(_RENDER_POOL_SIZE, os.cpu_count() or 1),
+        mp_context=_mp_context(),
+    )
+
+
+async def run_in_process_pool(fn, /, **kwargs):
+    """Run ``fn(**kwargs)`` in the worker process pool and await it."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _process_pool, functools.partial(fn, **kwargs)
+    )
+
 
 # ---------------------------------------------------------------------------
 # Application setup
 # ---------------------------------------------------------------------------
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start the log writer and worker process pools for the app's lifetime."""
+    global _process_pool, _render_pool
+    _log_listener.start()
+    _process_pool = _start_process_pool()
+    _render_pool = _start_render_pool()
+    try:
+        yield
+    finally:
+        _render_pool.shutdown(cancel_futures=True)
+        _process_pool.shutdown(cancel_futures=True)
+        _log_listener.stop()
+
+
 app = FastAPI(
     title="Quantum Circuit Debugger API",
     description="Backend API for building, simulating, optimising, and exporting quantum circuits.",
     version="2.0.0",
+    lifespan=lifespan,
 )
+app.router.route_class = LoggedRoute
 
 # Allow cross-origin requests from the Next.js frontend during development
-import os
-
 app.add_middleware(
     CORSMiddleware,
     allow_origins=[
@@ -66,6 +307,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-SV-Shape", "X-SV-Dtype", "X-Bloch-Lengths"],
 )
 
 
@@ -91,39 +333,93 @@ def health_check():
 # ---------------------------------------------------------------------------
 
 
-@app.post("/execute", response_model=ExecutionResult)
-async def execute_circuit_endpoint(request: CircuitRequest):
+@app.post("/execute", response_model=ExecutionResult, openapi_extra=CIRCUIT_BODY_DOC)
+async def execute_circuit_endpoint(request: CircuitRequest = CIRCUIT_BODY):
     """
     Simulate a quantum circuit and return measurement counts + statevector.
 
     The circuit is built from the list of gates, executed on the Aer
     simulator for the requested number of shots, and the statevector is
     extracted from a separate measurement-free run.
+
+    ``shots=0`` skips the sampling run (statevector-only mode), and
+    ``skip_statevector=True`` skips the statevector run (counts-only mode).
+    ``sparse_counts=True`` returns the histogram as integer arrays, and
+    ``sv_encoding="float32_b64"`` the statevector as one Base64 string.
+    The statevector is also omitted above ``MAX_SV_QUBITS`` qubits.
     """
-    try:
-        gates_data = [gate.model_dump() for gate in request.gates]
-        circuit = build_circuit(request.num_qubits, gates_data)
+    circuit = build_circuit(request.num_qubits, request.gates)
+
+    # Statevector (best-effort — does not block counts).  Taken first, while
+    # the circuit has no measurements, so it can be simulated without a copy
+    result_sv = {}
+    if not request.skip_statevector and request.num_qubits <= MAX_SV_QUBITS:
+        # Aer runs off the event loop, so other requests keep being served
+        result_sv = await asyncio.to_thread(
+            get_statevector,
+            circuit,
+            assume_no_measurements=True,
+            encoding=request.sv_encoding,
+        )
+        if "error" in result_sv:
+            logger.warning("statevector failed: %s", result_sv["error"])
 
-        # Measurement counts
-        result_counts = run_circuit(circuit, shots=request.shots)
+    # Measurement counts
+    if request.shots > 0:
+        result_counts = await asyncio.to_thread(
+            run_qc, circuit, shots=request.shots, sparse=request.sparse_counts
+        )
         if "error" in result_counts:
             raise HTTPException(status_code=500, detail=result_counts["error"])
+    else:
+        result_counts = {"counts": {}}
+
+    # Server-built data is trusted: skip re-validating every counts entry
+    return ExecutionResult.model_construct(
+        counts=result_counts.get("counts", {}),
+        count_keys=result_counts.get("count_keys"),
+        count_values=result_counts.get("count_values"),
+        statevector=result_sv.get("statevector"),
+        statevector_b64=result_sv.get("statevector_b64"),
+        sv_shape=result_sv.get("shape"),
+        sv_dtype=result_sv.get("dtype"),
+        status="completed",
+    )
+
+
+@app.post("/execute/statevector.bin", openapi_extra=CIRCUIT_BODY_DOC)
+async def execute_statevector_binary_endpoint(request: CircuitRequest = CIRCUIT_BODY):
+    """
+    Simulate a circuit and return its statevector as raw binary.
+
+    The body is the little-endian ``complex64`` buffer (interleaved
+    ``float32`` real/imag pairs), 8 bytes per amplitude — roughly 4× smaller
+    than the JSON ``[[real, imag], ...]`` form returned by ``/execute``.
+    Clients must reinterpret it themselves, e.g. in the browser
+    ``new Float32Array(await res.arrayBuffer())`` and read pairs
+    ``(re, im) = (f[2k], f[2k+1])`` for basis state ``k``.
+
+    Response headers:
+        X-SV-Shape: Number of amplitudes (``2**num_qubits``).
+        X-SV-Dtype: Always ``complex64``.
+    """
+    if request.num_qubits > MAX_SV_QUBITS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Statevector is limited to {MAX_SV_QUBITS} qubits.",
+        )
 
-        # Statevector (best-effort — does not block counts)
-        result_sv = get_statevector(circuit)
-        if "error" in result_sv:
-            print(f"[WARN] Statevector error: {result_sv['error']}")
+    circuit = build_circuit(request.num_qubits, request.gates)
 
-        return ExecutionResult(
-            counts=result_counts.get("counts", {}),
-            statevector=result_sv.get("statevector"),
-            status="completed",
-        )
-    except HTTPException:
-        raise
-    except Exception as e:
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=str(e))
+    sv = await asyncio.to_thread(
+        simulate_statevector, circuit, assume_no_measurements=True
+    )
+    sv = np.asarray(sv, dtype=np.complex64)
+    return Response(
+        content=sv.tobytes(),
+        media_type="application/octet-stream",
+        headers={"X-SV-Shape": str(sv.shape[0]), "X-SV-Dtype": "complex64"},
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -131,26 +427,26 @@ async def execute_circuit_endpoint(request: CircuitRequest):
 # ---------------------------------------------------------------------------
 
 
-@app.post("/optimize")
-async def optimize_circuit_endpoint(request: CircuitRequest):
+@app.post(
+    "/optimize", response_model=OptimizationResult, openapi_extra=CIRCUIT_BODY_DOC
+)
+async def optimize_circuit_endpoint(request: CircuitRequest = CIRCUIT_BODY):
     """
     Optimise the circuit using Qiskit's transpiler (level 3) and return
     a comparison of original vs. optimised depth and gate counts.
+
+    Empty or single fixed-gate circuits (or ``skip_transpile=True``) are
+    reported as-is.
     """
-    try:
-        gates_data = [gate.model_dump() for gate in request.gates]
-        circuit = build_circuit(request.num_qubits, gates_data)
+    circuit = build_circuit(request.num_qubits, request.gates)
 
-        result = optimize_circuit(circuit)
-        if "error" in result:
-            raise HTTPException(status_code=500, detail=result["error"])
+    result = await optimize_circuit(
+        circuit, skip_transpile=request.skip_transpile, executor=_process_pool
+    )
+    if "error" in result:
+        raise HTTPException(status_code=500, detail=result["error"])
 
-        return result
-    except HTTPException:
-        raise
-    except Exception as e:
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=str(e))
+    return OptimizationResult.model_construct(**result)
 
 
 # ---------------------------------------------------------------------------
@@ -158,57 +454,82 @@ async def optimize_circuit_endpoint(request: CircuitRequest):
 # ---------------------------------------------------------------------------
 
 
-@app.post("/export/latex")
-async def export_latex(request: CircuitRequest):
+@app.post("/export/latex", openapi_extra=CIRCUIT_BODY_DOC)
+async def export_latex(request: CircuitRequest = CIRCUIT_BODY):
     """Generate LaTeX source code for the quantum circuit diagram."""
-    try:
-        gates_data = [gate.model_dump() for gate in request.gates]
-        circuit = build_circuit(request.num_qubits, gates_data)
-        latex_source = circuit.draw(output="latex_source")
-        return {"latex": latex_source}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    circuit = build_circuit(request.num_qubits, request.gates)
+    latex_source = circuit.draw(output="latex_source")
+    return {"latex": latex_source}
 
 
-@app.post("/export/image")
-async def export_image(request: CircuitRequest):
+@app.post("/export/image", openapi_extra=CIRCUIT_BODY_DOC)
+async def export_image(request: CircuitRequest = CIRCUIT_BODY):
     """Render the circuit as a PNG image and return it Base64-encoded."""
-    try:
-        import base64
-        from io import BytesIO
+    circuit = build_circuit(request.num_qubits, request.gates)
 
-        gates_data = [gate.model_dump() for gate in request.gates]
-        circuit = build_circuit(request.num_qubits, gates_data)
+    fig = circuit.draw(output="mpl")
+    buf = BytesIO()
+    fig.savefig(buf, format="png")
+    buf.seek(0)
+    img_str = base64.b64encode(buf.read()).decode("utf-8")
 
-        fig = circuit.draw(output="mpl")
-        buf = BytesIO()
-        fig.savefig(buf, format="png")
-        buf.seek(0)
-        img_str = base64.b64encode(buf.read()).decode("utf-8")
+    return {"image_base64": img_str}
 
-        return {"image_base64": img_str}
-    except Exception as e:
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/export/bloch", openapi_extra=CIRCUIT_BODY_DOC)
+async def export_bloch_sphere_endpoint(
+    request: CircuitRequest = CIRCUIT_BODY,
+    include_statevector: bool = Query(
+        False, description="Also return the statevector as [real, imag] pairs."
+    ),
+):
+    """
+    Generate per-qubit Bloch sphere images (Base64 PNGs).
 
-@app.post("/export/bloch")
-async def export_bloch_sphere_endpoint(request: CircuitRequest):
-    """Generate per-qubit Bloch sphere images (Base64 PNGs)."""
-    try:
-        gates_data = [gate.model_dump() for gate in request.gates]
-        circuit = build_circuit(request.num_qubits, gates_data)
+    ``?include_statevector=true`` adds ``statevector`` to the response from
+    the same simulation, saving a separate ``/execute`` statevector run.
+    """
+    circuit = build_circuit(request.num_qubits, request.gates)
+
+    result = await get_bloch_image_async(
+        circuit,
+        assume_no_measurements=True,
+        executor=_render_pool,
+        include_statevector=include_statevector,
+    )
+    if "error" in result:
+        raise HTTPException(status_code=500, detail=result["error"])
+
+    return result
 
-        result = get_bloch_image(circuit)
-        if "error" in result:
-            raise HTTPException(status_code=500, detail=result["error"])
 
-        return result
-    except HTTPException:
-        raise
-    except Exception as e:
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=str(e))
+@app.post("/export/bloch.bin", openapi_extra=CIRCUIT_BODY_DOC)
+async def export_bloch_binary_endpoint(request: CircuitRequest = CIRCUIT_BODY):
+    """
+    Generate per-qubit Bloch sphere images as raw concatenated PNGs.
+
+    Skips the Base64 step (and its 33 % size overhead) of ``/export/bloch``.
+    The body is the qubit-0 PNG followed by qubit 1's, and so on; split it
+    with the byte lengths listed in the ``X-Bloch-Lengths`` header, e.g. in
+    the browser ``new Blob([buf.slice(off, off + len)], {type: "image/png"})``.
+
+    Response headers:
+        X-Bloch-Lengths: Comma-separated PNG sizes in bytes, in qubit order.
+    """
+    circuit = build_circuit(request.num_qubits, request.gates)
+
+    result = await get_bloch_image_async(
+        circuit, binary=True, assume_no_measurements=True, executor=_render_pool
+    )
+    if "error" in result:
+        raise HTTPException(status_code=500, detail=result["error"])
+
+    images = result["bloch_images"]
+    return Response(
+        content=b"".join(images),
+        media_type="application/octet-stream",
+        headers={"X-Bloch-Lengths": ",".join(str(len(png)) for png in images)},
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -225,29 +546,24 @@ async def run_algorithm_endpoint(request: AlgorithmRequest):
     parameters that the classical optimiser adjusts to minimise the
     Hamiltonian expectation value.
     """
-    try:
-        result = run_optimization(
-            circuit_data=request.circuit,
-            hamiltonian_str=request.hamiltonian,
-            max_iter=request.max_iter,
-            method=request.optimizer,
-        )
-
-        if result.get("status") == "failed":
-            raise HTTPException(status_code=500, detail=result.get("error"))
-
-        return AlgorithmResponse(
-            status="completed",
-            optimal_energy=result.get("optimal_energy"),
-            optimal_params=result.get("optimal_params"),
-            history=result.get("history"),
-            message=result.get("message"),
-        )
-    except HTTPException:
-        raise
-    except Exception as e:
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=str(e))
+    result = await run_in_process_pool(
+        run_optimization,
+        circuit_data=request.circuit,
+        hamiltonian_str=request.hamiltonian,
+        max_iter=request.max_iter,
+        method=request.optimizer,
+    )
+
+    if result.get("status") == "failed":
+        raise HTTPException(status_code=500, detail=result.get("error"))
+
+    return AlgorithmResponse.model_construct(
+        status="completed",
+        optimal_energy=result.get("optimal_energy"),
+        optimal_params=result.get("optimal_params"),
+        history=result.get("history"),
+        message=result.get("message"),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -264,40 +580,36 @@ async def run_qft_endpoint(request: QFTRequest):
     applying QFT (or inverse QFT).  Returns measurement counts,
     statevector, circuit depth, and total gate count.
     """
-    try:
-        # Build the QFT circuit
-        qft_circuit = build_qft_circuit(request.num_qubits, inverse=request.inverse)
-
-        # Optionally prepend X gates to set the initial state
-        if request.initial_state:
-            from qiskit import QuantumCircuit
-
-            init_qc = QuantumCircuit(request.num_qubits)
-            for i, bit in enumerate(reversed(request.initial_state)):
-                if bit == "1":
-                    init_qc.x(i)
-            full_circuit = init_qc.compose(qft_circuit)
-        else:
-            full_circuit = qft_circuit
-
-        # Gather metrics
-        depth = full_circuit.depth()
-        num_gates = sum(full_circuit.count_ops().values())
-
-        # Simulate
-        result_counts = run_circuit(full_circuit, shots=request.shots)
-        result_sv = get_statevector(full_circuit)
-
-        return QFTResponse(
-            counts=result_counts.get("counts"),
-            statevector=result_sv.get("statevector"),
-            circuit_depth=depth,
-            num_gates=num_gates,
-            status="completed",
-        )
-    except Exception as e:
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=str(e))
+    # Build the QFT circuit
+    qft_circuit = build_qft_circuit(request.num_qubits, inverse=request.inverse)
+
+    # Optionally prepend X gates to set the initial state
+    if request.initial_state:
+        init_qc = QuantumCircuit(request.num_qubits)
+        for i, bit in enumerate(reversed(request.initial_state)):
+            if bit == "1":
+                init_qc.x(i)
+        # Append in place — avoids allocating a third circuit
+        init_qc.compose(qft_circuit, qubits=range(request.num_qubits), inplace=True)
+        full_circuit = init_qc
+    else:
+        full_circuit = qft_circuit
+
+    # Gather metrics
+    depth = full_circuit.depth()
+    num_gates = sum(full_circuit.count_ops().values())
+
+    # Simulate (statevector first: run_qc appends measurements)
+    result_sv = get_statevector(full_circuit, assume_no_measurements=True)
+    result_counts = run_qc(full_circuit, shots=request.shots)
+
+    return QFTResponse.model_construct(
+        counts=result_counts.get("counts"),
+        statevector=result_sv.get("statevector"),
+        circuit_depth=depth,
+        num_gates=num_gates,
+        status="completed",
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -306,81 +618,80 @@ async def run_qft_endpoint(request: QFTRequest):
 
 
 @app.post("/qaoa", response_model=QAOAResponse)
-async def run_qaoa_endpoint(request: QAOARequest):
+async def run_qaoa_endpoint(
+    request: QAOARequest,
+    frameworks: tuple[str, ...] = Depends(codegen_frameworks),
+):
     """
     Run a full QAOA optimization for an Ising-model cost Hamiltonian.
 
     Accepts an interaction matrix J_{ij}, number of QAOA layers, and
     optimizer settings.  Returns optimal parameters, measurement counts,
     statevector probabilities, convergence history, and auto-generated
-    code for Qiskit, PennyLane, Cirq, Q#, and OpenQASM.
+    code for Qiskit, PennyLane, Cirq, Q#, and OpenQASM (or the subset
+    selected with ``?codegen=``).
     """
-    try:
-        result = run_qaoa(
+    qaoa_args = dict(
+        num_qubits=request.num_qubits,
+        interaction_matrix=request.interaction_matrix,
+        p_layers=request.p_layers,
+        max_iter=request.max_iter,
+        method=request.optimizer,
+        shots=request.shots,
+        linear_terms=request.linear_terms,
+    )
+    cache_key = ResultCache.make_key(qaoa_args)
+    result = None if request.force_rerun else _qaoa_cache.get(cache_key)
+    if result is None:
+        result = await run_in_process_pool(run_qaoa, **qaoa_args)
+        _qaoa_cache.set(cache_key, result)
+
+    # Generate code for the requested frameworks
+    code = {}
+    for fw in frameworks:
+        code[fw] = generate_qaoa_code(
             num_qubits=request.num_qubits,
             interaction_matrix=request.interaction_matrix,
-            p_layers=request.p_layers,
-            max_iter=request.max_iter,
-            method=request.optimizer,
-            shots=request.shots,
+            opt_gammas=result["optimal_gammas"],
+            opt_betas=result["optimal_betas"],
+            framework=fw,
             linear_terms=request.linear_terms,
         )
 
-        # Generate code for all frameworks
-        code = {}
-        for fw in ("qiskit", "pennylane", "cirq", "qsharp", "qasm"):
-            code[fw] = generate_qaoa_code(
-                num_qubits=request.num_qubits,
-                interaction_matrix=request.interaction_matrix,
-                opt_gammas=result["optimal_gammas"],
-                opt_betas=result["optimal_betas"],
-                framework=fw,
-                linear_terms=request.linear_terms,
-            )
-
-        # Generate circuit diagram
-        circuit_diagram = None
-        try:
-            import base64
-            from io import BytesIO
-            import matplotlib
-            matplotlib.use("Agg")
-
-            qc = build_qaoa_circuit(
-                num_qubits=request.num_qubits,
-                interaction_matrix=request.interaction_matrix,
-                gammas=result["optimal_gammas"],
-                betas=result["optimal_betas"],
-                linear_terms=request.linear_terms,
-            )
-            fig = qc.draw(output="mpl")
-            buf = BytesIO()
-            fig.savefig(buf, format="png", bbox_inches="tight", dpi=120)
-            buf.seek(0)
-            circuit_diagram = base64.b64encode(buf.read()).decode("utf-8")
-            import matplotlib.pyplot as plt
-            plt.close(fig)
-        except Exception:
-            pass  # diagram is optional, don't fail the request
-
-        return QAOAResponse(
-            status="completed",
-            optimal_energy=result["optimal_energy"],
-            optimal_gammas=result["optimal_gammas"],
-            optimal_betas=result["optimal_betas"],
-            optimal_params=result["optimal_params"],
-            history=result["history"],
-            counts=result["counts"],
-            probabilities=result["probabilities"],
-            most_likely_state=result["most_likely_state"],
-            p_layers=result["p_layers"],
-            code=code,
-            circuit_diagram=circuit_diagram,
-            message=result.get("message"),
+    # Generate circuit diagram
+    circuit_diagram = None
+    try:
+        qc = build_qaoa_circuit(
+            num_qubits=request.num_qubits,
+            interaction_matrix=request.interaction_matrix,
+            gammas=result["optimal_gammas"],
+            betas=result["optimal_betas"],
+            linear_terms=request.linear_terms,
         )
-    except Exception as e:
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=str(e))
+        fig = qc.draw(output="mpl")
+        buf = BytesIO()
+        fig.savefig(buf, format="png", bbox_inches="tight", dpi=120)
+        buf.seek(0)
+        circuit_diagram = base64.b64encode(buf.read()).decode("utf-8")
+        plt.close(fig)
+    except Exception:
+        pass  # diagram is optional, don't fail the request
+
+    return QAOAResponse.model_construct(
+        status="completed",
+        optimal_energy=result["optimal_energy"],
+        optimal_gammas=result["optimal_gammas"],
+        optimal_betas=result["optimal_betas"],
+        optimal_params=result["optimal_params"],
+        history=result["history"],
+        counts=result["counts"],
+        probabilities=result["probabilities"],
+        most_likely_state=result["most_likely_state"],
+        p_layers=result["p_layers"],
+        code=code,
+        circuit_diagram=circuit_diagram,
+        message=result.get("message"),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -389,111 +700,107 @@ async def run_qaoa_endpoint(request: QAOARequest):
 
 
 @app.post("/vqe", response_model=VQEResponse)
-async def run_vqe_endpoint(request: VQERequest):
+async def run_vqe_endpoint(
+    request: VQERequest,
+    frameworks: tuple[str, ...] = Depends(codegen_frameworks),
+):
     """
     Run a full standalone VQE optimization.
 
     Accepts Hamiltonian bases/scales, builds an RY ansatz internally,
     optimises parameters, and returns measurement counts, convergence
-    history, and auto-generated code for all five frameworks.
+    history, and auto-generated code for all five frameworks (or those
+    selected with ``?codegen=``).
     """
-    try:
-        # Determine bases/scales from adjacency matrix or direct input
-        is_maxcut = (
-            request.problem_type == "maxcut" and request.adjacency_matrix is not None
+    # Determine bases/scales from adjacency matrix or direct input
+    is_maxcut = (
+        request.problem_type == "maxcut" and request.adjacency_matrix is not None
+    )
+
+    if is_maxcut:
+        h_bases, h_scales = maxcut_hamiltonian_from_adjacency(
+            request.adjacency_matrix,
+            invert=request.invert_adjacency,
+        )
+        # Auto-derive num_qubits from adjacency matrix dimensions
+        n_qubits = len(request.adjacency_matrix)
+    else:
+        h_bases = request.hamiltonian_bases or []
+        h_scales = request.hamiltonian_scales or []
+        n_qubits = request.num_qubits
+
+    if not h_bases:
+        raise HTTPException(
+            status_code=400,
+            detail="Provide hamiltonian_bases/scales or adjacency_matrix with problem_type='maxcut'.",
         )
 
+    vqe_args = dict(
+        num_qubits=n_qubits,
+        hamiltonian_bases=h_bases,
+        hamiltonian_scales=h_scales,
+        ansatz_depth=request.ansatz_depth,
+        max_iter=request.max_iter,
+        method=request.optimizer,
+        shots=request.shots,
+    )
+    cache_key = ResultCache.make_key(vqe_args)
+    result = None if request.force_rerun else _vqe_cache.get(cache_key)
+    if result is None:
+        result = await run_in_process_pool(run_vqe, **vqe_args)
+        _vqe_cache.set(cache_key, result)
+
+    # Generate code for the requested frameworks
+    code = {}
+    for fw in frameworks:
         if is_maxcut:
-            h_bases, h_scales = maxcut_hamiltonian_from_adjacency(
-                request.adjacency_matrix,
-                invert=request.invert_adjacency,
+            code[fw] = generate_maxcut_code(
+                adjacency_matrix=request.adjacency_matrix,
+                opt_params=result["optimal_params"],
+                invert_adjacency=request.invert_adjacency,
+                framework=fw,
             )
-            # Auto-derive num_qubits from adjacency matrix dimensions
-            n_qubits = len(request.adjacency_matrix)
         else:
-            h_bases = request.hamiltonian_bases or []
-            h_scales = request.hamiltonian_scales or []
-            n_qubits = request.num_qubits
-
-        if not h_bases:
-            raise HTTPException(
-                status_code=400,
-                detail="Provide hamiltonian_bases/scales or adjacency_matrix with problem_type='maxcut'.",
+            code[fw] = generate_vqe_code(
+                num_qubits=n_qubits,
+                hamiltonian_bases=h_bases,
+                hamiltonian_scales=h_scales,
+                opt_params=result["optimal_params"],
+                ansatz_depth=request.ansatz_depth,
+                framework=fw,
             )
 
-        result = run_vqe(
-            num_qubits=n_qubits,
-            hamiltonian_bases=h_bases,
-            hamiltonian_scales=h_scales,
-            ansatz_depth=request.ansatz_depth,
-            max_iter=request.max_iter,
-            method=request.optimizer,
-            shots=request.shots,
-        )
-
-        # Generate code for all frameworks
-        code = {}
-        for fw in ("qiskit", "pennylane", "cirq", "qsharp", "qasm"):
-            if is_maxcut:
-                code[fw] = generate_maxcut_code(
-                    adjacency_matrix=request.adjacency_matrix,
-                    opt_params=result["optimal_params"],
-                    invert_adjacency=request.invert_adjacency,
-                    framework=fw,
-                )
-            else:
-                code[fw] = generate_vqe_code(
-                    num_qubits=n_qubits,
-                    hamiltonian_bases=h_bases,
-                    hamiltonian_scales=h_scales,
-                    opt_params=result["optimal_params"],
-                    ansatz_depth=request.ansatz_depth,
-                    framework=fw,
-                )
-
-        # Generate circuit diagram
-        circuit_diagram = None
-        try:
-            import base64
-            from io import BytesIO
-            import matplotlib
-            matplotlib.use("Agg")
-            import numpy as np
-
-            ansatz, params = build_vqe_ansatz(n_qubits, request.ansatz_depth)
-            bound = ansatz.assign_parameters(
-                dict(zip(params, result["optimal_params"]))
-            )
-            fig = bound.draw(output="mpl")
-            buf = BytesIO()
-            fig.savefig(buf, format="png", bbox_inches="tight", dpi=120)
-            buf.seek(0)
-            circuit_diagram = base64.b64encode(buf.read()).decode("utf-8")
-            import matplotlib.pyplot as plt
-            plt.close(fig)
-        except Exception:
-            pass  # diagram is optional, don't fail the request
-
-        return VQEResponse(
-            status="completed",
-            optimal_energy=result["optimal_energy"],
-            optimal_params=result["optimal_params"],
-            history=result["history"],
-            counts=result["counts"],
-            probabilities=result["probabilities"],
-            most_likely_state=result["most_likely_state"],
-            ansatz_depth=result["ansatz_depth"],
-            code=code,
-            circuit_diagram=circuit_diagram,
-            hamiltonian_bases=h_bases,
-            hamiltonian_scales=h_scales,
-            message=result.get("message"),
+    # Generate circuit diagram
+    circuit_diagram = None
+    try:
+        ansatz, params = build_vqe_ansatz(n_qubits, request.ansatz_depth)
+        bound = ansatz.assign_parameters(
+            dict(zip(params, result["optimal_params"]))
         )
-    except HTTPException:
-        raise
-    except Exception as e:
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=str(e))
+        fig = bound.draw(output="mpl")
+        buf = BytesIO()
+        fig.savefig(buf, format="png", bbox_inches="tight", dpi=120)
+        buf.seek(0)
+        circuit_diagram = base64.b64encode(buf.read()).decode("utf-8")
+        plt.close(fig)
+    except Exception:
+        pass  # diagram is optional, don't fail the request
+
+    return VQEResponse.model_construct(
+        status="completed",
+        optimal_energy=result["optimal_energy"],
+        optimal_params=result["optimal_params"],
+        history=result["history"],
+        counts=result["counts"],
+        probabilities=result["probabilities"],
+        most_likely_state=result["most_likely_state"],
+        ansatz_depth=result["ansatz_depth"],
+        code=code,
+        circuit_diagram=circuit_diagram,
+        hamiltonian_bases=h_bases,
+        hamiltonian_scales=h_scales,
+        message=result.get("message"),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -502,54 +809,53 @@ async def run_vqe_endpoint(request: VQERequest):
 
 
 @app.post("/quantum-walk", response_model=QuantumWalkResponse)
-async def run_quantum_walk_endpoint(request: QuantumWalkRequest):
+async def run_quantum_walk_endpoint(
+    request: QuantumWalkRequest,
+    frameworks: tuple[str, ...] = Depends(codegen_frameworks),
+):
     """
     Run a Continuous-Time Quantum Walk (CTQW) on a graph.
 
     Provide ``topology`` + ``num_vertices`` to auto-generate a graph, or
     supply a custom ``adjacency_matrix``.
     """
-    try:
-        # Build adjacency matrix
-        if request.adjacency_matrix:
-            adj = request.adjacency_matrix
-        elif request.topology:
-            adj = generate_graph(request.topology, request.num_vertices)
-        else:
-            adj = generate_graph("cycle", request.num_vertices)
-
-        result = run_quantum_walk(
+    # Build adjacency matrix
+    if request.adjacency_matrix:
+        adj = request.adjacency_matrix
+    elif request.topology:
+        adj = generate_graph(request.topology, request.num_vertices)
+    else:
+        adj = generate_graph("cycle", request.num_vertices)
+
+    result = run_quantum_walk(
+        adjacency_matrix=adj,
+        initial_vertex=request.initial_vertex,
+        num_steps=request.num_steps,
+        dt=request.dt,
+        shots=request.shots,
+    )
+
+    # Generate code for the requested frameworks
+    code = {}
+    for fw in frameworks:
+        code[fw] = generate_walk_code(
             adjacency_matrix=adj,
             initial_vertex=request.initial_vertex,
             num_steps=request.num_steps,
             dt=request.dt,
-            shots=request.shots,
+            framework=fw,
         )
 
-        # Generate code for all frameworks
-        code = {}
-        for fw in ("qiskit", "pennylane", "cirq", "qsharp", "qasm"):
-            code[fw] = generate_walk_code(
-                adjacency_matrix=adj,
-                initial_vertex=request.initial_vertex,
-                num_steps=request.num_steps,
-                dt=request.dt,
-                framework=fw,
-            )
-
-        return QuantumWalkResponse(
-            status="completed",
-            probability_evolution=result["probability_evolution"],
-            final_counts=result["final_counts"],
-            most_likely_vertex=result["most_likely_vertex"],
-            most_likely_state=result["most_likely_state"],
-            num_vertices=result["num_vertices"],
-            num_qubits=result["num_qubits"],
-            num_steps=result["num_steps"],
-            dt=result["dt"],
-            initial_vertex=result["initial_vertex"],
-            code=code,
-        )
-    except Exception as e:
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=str(e))
+    return QuantumWalkResponse.model_construct(
+        status="completed",
+        probability_evolution=result["probability_evolution"],
+        final_counts=result["final_counts"],
+        most_likely_vertex=result["most_likely_vertex"],
+        most_likely_state=result["most_likely_state"],
+        num_vertices=result["num_vertices"],
+        num_qubits=result["num_qubits"],
+        num_steps=result["num_steps"],
+        dt=result["dt"],
+        initial_vertex=result["initial_vertex"],
+        code=code,
+    )
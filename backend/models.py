@@ -5,8 +5,53 @@ These models enforce strict input validation and provide clear documentation
 of the JSON contract between the frontend and backend.
 """
 
-from pydantic import BaseModel, Field
-from typing import List, Optional, Dict
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field
+from typing import Annotated, List, Literal, Optional, Dict
+from typing_extensions import Required, TypedDict
+
+# Fixed vocabularies, validated by pydantic-core as a single set lookup
+Optimizer = Literal["COBYLA", "L-BFGS-B", "SLSQP", "Nelder-Mead"]
+Topology = Literal["cycle", "path", "complete", "star", "grid", "custom"]
+GateName = Literal[
+    "H", "X", "Y", "Z", "S", "T",
+    "RX", "RY", "RZ",
+    "CNOT", "CX", "CY", "CZ", "CH", "SWAP",
+    "CRX", "CRY", "CRZ", "CP",
+    "CCX", "TOFFOLI", "CSWAP", "FREDKIN",
+    "M",
+]
+
+
+def _upper(value):
+    """Upper-case string input so gate names stay case-insensitive."""
+    return value.upper() if isinstance(value, str) else value
+
+
+# ---------------------------------------------------------------------------
+# Base model
+# ---------------------------------------------------------------------------
+
+
+class APIModel(BaseModel):
+    """
+    Base class for every request / response model.
+
+    Core-schema construction is deferred so importing this module is cheap;
+    :func:`rebuild_models` compiles them all once, before routes are declared.
+    """
+
+    model_config = ConfigDict(defer_build=True)
+
+
+class APIResponse(APIModel):
+    """
+    Base class for response models.
+
+    Responses are built once by the server and serialised straight away, so
+    they are immutable and silently drop unknown keys.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="ignore")
 
 
 # ---------------------------------------------------------------------------
@@ -14,13 +59,16 @@ from typing import List, Optional, Dict
 # ---------------------------------------------------------------------------
 
 
-class QuantumGate(BaseModel):
+# A TypedDict rather than a BaseModel: pydantic validates each gate inline
+# in the parent's schema and yields a plain dict, so no model instance is
+# built per gate and handlers can pass ``request.gates`` straight through.
+class QuantumGate(TypedDict, total=False):
     """
     A single quantum gate in a circuit.
 
     Attributes:
-        name:   Gate identifier (case-insensitive). Supported values include
-                ``H``, ``X``, ``Y``, ``Z``, ``S``, ``T``,
+        name:   Gate identifier (case-insensitive, normalised to upper
+                case). One of ``H``, ``X``, ``Y``, ``Z``, ``S``, ``T``,
                 ``RX``, ``RY``, ``RZ``,
                 ``CNOT``/``CX``, ``CY``, ``CZ``, ``CH``, ``SWAP``,
                 ``CRX``, ``CRY``, ``CRZ``, ``CP``,
@@ -31,50 +79,111 @@ class QuantumGate(BaseModel):
                 gates such as ``RX``, ``CRZ``, ``CP``, etc.
     """
 
-    name: str
-    qubits: List[int]
-    params: Optional[List[float]] = None
+    name: Required[Annotated[GateName, BeforeValidator(_upper)]]
+    qubits: Required[List[int]]
+    params: Optional[List[float]]
 
 
-class CircuitRequest(BaseModel):
+class CircuitRequest(APIModel):
     """
     Request body for endpoints that accept a circuit definition.
 
     Attributes:
-        gates:      Ordered list of gates defining the circuit.
-        num_qubits: Total number of qubits in the register.
-        shots:      Number of measurement repetitions (default 1024).
+        gates:            Ordered list of gates defining the circuit.
+        num_qubits:       Total number of qubits in the register.
+        shots:            Number of measurement repetitions (default 1024).
+                          ``0`` skips sampling and returns empty counts
+                          (statevector-only mode).
+        skip_statevector: If ``True``, do not compute the statevector
+                          (counts-only mode).
+        skip_transpile:   If ``True``, ``/optimize`` reports the circuit
+                          as-is without running the transpiler.
+        sparse_counts:    If ``True``, ``/execute`` returns the histogram as
+                          ``count_keys`` / ``count_values`` arrays.
+        sv_encoding:      ``"float32_b64"`` makes ``/execute`` return the
+                          statevector as ``statevector_b64`` instead of
+                          ``[real, imag]`` pairs.
     """
 
     gates: List[QuantumGate]
     num_qubits: int = Field(..., ge=1, description="Number of qubits (≥ 1).")
-    shots: int = Field(1024, ge=1, description="Measurement shots (≥ 1).")
+    shots: int = Field(
+        1024, ge=0, description="Measurement shots (0 = statevector only)."
+    )
+    skip_statevector: bool = Field(
+        False, description="If True, return counts only (no statevector)."
+    )
+    skip_transpile: bool = Field(
+        False, description="If True, /optimize skips the transpiler."
+    )
+    sparse_counts: bool = Field(
+        False, description="If True, /execute returns counts as integer arrays."
+    )
+    sv_encoding: Literal["json", "float32_b64"] = Field(
+        "json", description="Statevector encoding returned by /execute."
+    )
 
 
-class ExecutionResult(BaseModel):
+class ExecutionResult(APIResponse):
     """
     Response body for circuit execution results.
 
     Attributes:
-        counts:      Mapping of basis-state bitstrings to measurement counts.
-        statevector: Final statevector as a list of ``[real, imag]`` pairs.
-                     ``None`` if statevector retrieval failed.
-        status:      ``"completed"`` or ``"failed"``.
-        error:       Human-readable error message (only on failure).
+        counts:       Mapping of basis-state bitstrings to measurement counts.
+                      Empty when ``sparse_counts`` was requested.
+        count_keys:   Measured basis states as integers (``sparse_counts``
+                      only); bit *i* is classical bit *i*.
+        count_values: Counts matching ``count_keys`` element-wise.
+        statevector:  Final statevector as a list of ``[real, imag]`` pairs.
+                      ``None`` if statevector retrieval failed.
+        statevector_b64: Final statevector as Base64 little-endian
+                      ``float32`` (real, imag) pairs (``sv_encoding=
+                      "float32_b64"`` only); decode with a ``Float32Array``.
+        sv_shape:     Shape of the decoded ``statevector_b64`` array,
+                      ``[2**n, 2]``.
+        sv_dtype:     Element type of ``statevector_b64`` (``"float32"``).
+        status:       ``"completed"`` or ``"failed"``.
+        error:        Human-readable error message (only on failure).
     """
 
     counts: Dict[str, int]
+    count_keys: Optional[List[int]] = None
+    count_values: Optional[List[int]] = None
     statevector: Optional[List[List[float]]] = None
+    statevector_b64: Optional[str] = None
+    sv_shape: Optional[List[int]] = None
+    sv_dtype: Optional[str] = None
     status: str
     error: Optional[str] = None
 
 
+class OptimizationResult(APIResponse):
+    """
+    Response body for ``/optimize``.
+
+    Attributes:
+        original_depth / optimized_depth: Circuit depths.
+        original_ops / optimized_ops:     Gate-name → count mappings.
+        optimized_qasm:    OpenQASM 2.0 source of the optimised circuit.
+        improvement_msg:   Human-readable comparison summary.
+        skipped:           ``True`` if the transpiler was not run.
+    """
+
+    original_depth: int
+    optimized_depth: int
+    original_ops: Dict[str, int]
+    optimized_ops: Dict[str, int]
+    optimized_qasm: str
+    improvement_msg: str
+    skipped: bool = False
+
+
 # ---------------------------------------------------------------------------
 # Algorithm (VQE / QAOA) models
 # ---------------------------------------------------------------------------
 
 
-class AlgorithmRequest(BaseModel):
+class AlgorithmRequest(APIModel):
     """
     Request body for running a variational quantum algorithm.
 
@@ -83,17 +192,18 @@ class AlgorithmRequest(BaseModel):
         hamiltonian: Hamiltonian expression, e.g. ``"Z0 Z1 + 0.5 * X0"``.
         algorithm:   Algorithm type — ``"VQE"`` or ``"QAOA"``.
         max_iter:    Maximum classical optimisation iterations.
-        optimizer:   SciPy optimiser name (``COBYLA``, ``L-BFGS-B``, ``SLSQP``).
+        optimizer:   SciPy optimiser name (``COBYLA``, ``L-BFGS-B``, ``SLSQP``,
+                     ``Nelder-Mead``).
     """
 
     circuit: CircuitRequest
     hamiltonian: str
-    algorithm: str = "VQE"
+    algorithm: Literal["VQE", "QAOA"] = "VQE"
     max_iter: int = Field(50, ge=1)
-    optimizer: str = "COBYLA"
+    optimizer: Optimizer = "COBYLA"
 
 
-class AlgorithmResponse(BaseModel):
+class AlgorithmResponse(APIResponse):
     """
     Response body for algorithm execution.
 
@@ -119,7 +229,7 @@ class AlgorithmResponse(BaseModel):
 # ---------------------------------------------------------------------------
 
 
-class VQERequest(BaseModel):
+class VQERequest(APIModel):
     """
     Request body for the standalone VQE endpoint.
 
@@ -141,7 +251,7 @@ class VQERequest(BaseModel):
         None,
         description="Adjacency matrix for graph problems (MaxCut clustering).",
     )
-    problem_type: Optional[str] = Field(
+    problem_type: Optional[Literal["maxcut"]] = Field(
         None,
         description='Problem type: "maxcut" or None for custom Hamiltonian.',
     )
@@ -151,11 +261,14 @@ class VQERequest(BaseModel):
     )
     ansatz_depth: int = Field(1, ge=1, le=10, description="Ansatz layer depth (1–10).")
     max_iter: int = Field(100, ge=1, le=1000)
-    optimizer: str = "COBYLA"
+    optimizer: Optimizer = "COBYLA"
     shots: int = Field(1024, ge=1)
+    force_rerun: bool = Field(
+        False, description="Bypass the result cache and re-run the optimiser."
+    )
 
 
-class VQEResponse(BaseModel):
+class VQEResponse(APIResponse):
     """
     Response body for standalone VQE execution.
 
@@ -183,7 +296,7 @@ class VQEResponse(BaseModel):
 # ---------------------------------------------------------------------------
 
 
-class QFTRequest(BaseModel):
+class QFTRequest(APIModel):
     """
     Request body for the QFT endpoint.
 
@@ -201,7 +314,7 @@ class QFTRequest(BaseModel):
     shots: int = Field(1024, ge=1)
 
 
-class QFTResponse(BaseModel):
+class QFTResponse(APIResponse):
     """
     Response body for QFT execution.
 
@@ -227,7 +340,7 @@ class QFTResponse(BaseModel):
 # ---------------------------------------------------------------------------
 
 
-class QAOARequest(BaseModel):
+class QAOARequest(APIModel):
     """
     Request body for the QAOA endpoint.
 
@@ -239,6 +352,7 @@ class QAOARequest(BaseModel):
         max_iter:           Max classical optimizer iterations (default 100).
         optimizer:          SciPy optimizer name (default ``COBYLA``).
         shots:              Measurement shots for final circuit (default 1024).
+        force_rerun:        Bypass the result cache and re-run the optimiser.
     """
 
     num_qubits: int = Field(..., ge=2, description="Number of qubits (≥ 2).")
@@ -249,11 +363,14 @@ class QAOARequest(BaseModel):
     )
     p_layers: int = Field(1, ge=1, le=10, description="QAOA layers p (1–10).")
     max_iter: int = Field(100, ge=1, le=1000)
-    optimizer: str = "COBYLA"
+    optimizer: Optimizer = "COBYLA"
     shots: int = Field(1024, ge=1)
+    force_rerun: bool = Field(
+        False, description="Bypass the result cache and re-run the optimiser."
+    )
 
 
-class QAOAResponse(BaseModel):
+class QAOAResponse(APIResponse):
     """
     Response body for QAOA execution.
 
@@ -292,7 +409,7 @@ class QAOAResponse(BaseModel):
 # ---------------------------------------------------------------------------
 
 
-class QuantumWalkRequest(BaseModel):
+class QuantumWalkRequest(APIModel):
     """
     Request body for the quantum walk endpoint.
 
@@ -300,9 +417,9 @@ class QuantumWalkRequest(BaseModel):
     ``num_vertices`` to auto-generate a standard graph.
     """
 
-    topology: Optional[str] = Field(
+    topology: Optional[Topology] = Field(
         None,
-        description="Graph topology: cycle, path, complete, star, grid.",
+        description="Graph topology: cycle, path, complete, star, grid, custom.",
     )
     num_vertices: int = Field(4, ge=2, le=16, description="Number of graph vertices.")
     adjacency_matrix: Optional[List[List[float]]] = None
@@ -312,11 +429,20 @@ class QuantumWalkRequest(BaseModel):
     shots: int = Field(1024, ge=1)
 
 
-class QuantumWalkResponse(BaseModel):
+# Typed (rather than a bare ``dict``) so pydantic-core serialises each
+# snapshot with a fixed-shape serializer instead of inferring every value.
+class WalkSnapshot(TypedDict):
+    """Vertex probabilities of a quantum walk at one point in time."""
+
+    time: float
+    probabilities: List[float]
+
+
+class QuantumWalkResponse(APIResponse):
     """Response body for quantum walk execution."""
 
     status: str
-    probability_evolution: Optional[List[dict]] = None
+    probability_evolution: Optional[List[WalkSnapshot]] = None
     final_counts: Optional[Dict[str, int]] = None
     most_likely_vertex: Optional[int] = None
     most_likely_state: Optional[str] = None
@@ -327,3 +453,36 @@ class QuantumWalkResponse(BaseModel):
     initial_vertex: Optional[int] = None
     code: Optional[Dict[str, str]] = None
     error: Optional[str] = None
+
+
+# ---------------------------------------------------------------------------
+# Schema compilation
+# ---------------------------------------------------------------------------
+
+
+def rebuild_models() -> None:
+    """
+    Compile the deferred core schema of every API model.
+
+    Call once per process before declaring routes that use these models.
+    ``defer_build`` is cleared afterwards because a ``TypeAdapter`` over a
+    deferred model stays deferred even once the model is built — FastAPI's
+    per-route adapters would otherwise compile on their first request.
+    """
+    for model in (
+        CircuitRequest,
+        ExecutionResult,
+        OptimizationResult,
+        AlgorithmRequest,
+        AlgorithmResponse,
+        VQERequest,
+        VQEResponse,
+        QFTRequest,
+        QFTResponse,
+        QAOARequest,
+        QAOAResponse,
+        QuantumWalkRequest,
+        QuantumWalkResponse,
+    ):
+        model.model_rebuild()
+        model.model_config["defer_build"] = False
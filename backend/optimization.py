@@ -6,11 +6,34 @@ circuit depth and gate count, then re-exports the optimised circuit as
 OpenQASM 2.0.
 """
 
+import asyncio
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor
+from typing import Optional
+
 from qiskit import QuantumCircuit, transpile
 import qiskit.qasm2
 
+# ---------------------------------------------------------------------------
+# Report cache
+# ---------------------------------------------------------------------------
+# Level-3 transpilation is by far the heaviest step here, and the frontend
+# often re-submits the same circuit.  Reports are kept in a small LRU keyed
+# on a hash of the circuit's OpenQASM text.  ``seed_transpiler`` is fixed so
+# a cached report is exactly what a fresh run would produce.
+
+_REPORT_CACHE_SIZE = 256
+_report_cache: "OrderedDict[tuple, dict]" = OrderedDict()
+_report_cache_lock = threading.Lock()
+
 
-def optimize_circuit(circuit: QuantumCircuit) -> dict:
+async def optimize_circuit(
+    circuit: QuantumCircuit,
+    skip_transpile: bool = False,
+    executor: Optional[Executor] = None,
+) -> dict:
     """
     Analyse and optimise a quantum circuit via Qiskit's transpiler.
 
@@ -20,9 +43,25 @@ def optimize_circuit(circuit: QuantumCircuit) -> dict:
       - Two-qubit gate synthesis (KAK decomposition).
       - Layout and routing optimisations.
 
+    The transpiler itself runs in *executor* (the event loop's default
+    thread pool if ``None``), so the caller's event loop is never blocked;
+    pass a process pool to let several transpilations use separate cores.
+    Reports are cached in the calling process, keyed on the circuit's
+    OpenQASM text, so re-submitting an identical circuit skips the
+    transpiler and the QASM export entirely.
+
+    Empty circuits, and circuits of a single unparameterised gate, cannot be
+    improved, and the transpiler's fixed setup cost is skipped for them.  (A
+    lone rotation is still transpiled: ``RX(0)`` is removed entirely.)  The
+    report then has ``skipped`` set to ``True`` and the optimised metrics
+    equal the original ones.
+
     Args:
-        circuit: The circuit to optimise. May also be an OpenQASM string,
-                 which will be parsed automatically.
+        circuit:        The circuit to optimise. May also be an OpenQASM
+                        string, which will be parsed automatically.
+        skip_transpile: Always skip the transpiler and report the circuit
+                        as-is.
+        executor:       Where to run the transpiler.
 
     Returns:
         A dictionary containing:
@@ -30,33 +69,80 @@ def optimize_circuit(circuit: QuantumCircuit) -> dict:
           - ``original_ops``    / ``optimized_ops``:   Gate count dicts.
           - ``optimized_qasm``: OpenQASM 2.0 source of the optimised circuit.
           - ``improvement_msg``: Human-readable comparison summary.
+          - ``skipped``: ``True`` if the transpiler was not run.
           - ``error`` (only on failure): Error description.
     """
     try:
+        # String inputs are hashed as-is, so a cache hit skips parsing too
+        qasm = circuit if isinstance(circuit, str) else qiskit.qasm2.dumps(circuit)
+        key = (hashlib.blake2b(qasm.encode(), digest_size=16).digest(), skip_transpile)
+
+        with _report_cache_lock:
+            if key in _report_cache:
+                _report_cache.move_to_end(key)
+                return dict(_report_cache[key])
+
         if not isinstance(circuit, QuantumCircuit):
-            circuit = QuantumCircuit.from_qasm_str(circuit)
-
-        depth_original = circuit.depth()
-        count_original = circuit.count_ops()
-
-        # Level 3: heavy optimisation (KAK, commutative cancellation, …)
-        optimized = transpile(circuit, optimization_level=3)
-        depth_optimized = optimized.depth()
-        count_optimized = optimized.count_ops()
-
-        total_orig = sum(count_original.values())
-        total_opt = sum(count_optimized.values())
-
-        return {
-            "original_depth": depth_original,
-            "optimized_depth": depth_optimized,
-            "original_ops": count_original,
-            "optimized_ops": count_optimized,
-            "optimized_qasm": qiskit.qasm2.dumps(optimized),
-            "improvement_msg": (
-                f"Reduced depth from {depth_original} to {depth_optimized}. "
-                f"Gates: {total_orig} → {total_opt}"
-            ),
-        }
+            circuit = QuantumCircuit.from_qasm_str(qasm)
+
+        skipped = skip_transpile or _is_trivial(circuit)
+        if skipped:
+            # Reported as-is: the key's QASM text is already the export
+            optimized, optimized_qasm = circuit, qasm
+        else:
+            # QASM text is what crosses the process boundary (cheap to pickle)
+            loop = asyncio.get_running_loop()
+            optimized = await loop.run_in_executor(executor, _transpile_worker, qasm)
+            optimized_qasm = qiskit.qasm2.dumps(optimized)
+        report = _build_report(circuit, optimized, optimized_qasm, skipped)
+
+        with _report_cache_lock:
+            _report_cache[key] = report
+            if len(_report_cache) > _REPORT_CACHE_SIZE:
+                _report_cache.popitem(last=False)
+        return dict(report)
     except Exception as e:
         return {"error": str(e)}
+
+
+def _is_trivial(circuit: QuantumCircuit) -> bool:
+    """True for circuits the transpiler cannot shrink: no gates, or one fixed gate."""
+    data = circuit.data
+    return len(data) == 0 or (len(data) == 1 and not data[0].operation.params)
+
+
+def _transpile_worker(qasm: str) -> QuantumCircuit:
+    """Parse *qasm* and run the level-3 transpiler (runs in a worker)."""
+    circuit = QuantumCircuit.from_qasm_str(qasm)
+    # Level 3: heavy optimisation (KAK, commutative cancellation, …)
+    return transpile(circuit, optimization_level=3, seed_transpiler=0)
+
+
+def _build_report(
+    circuit: QuantumCircuit,
+    optimized: QuantumCircuit,
+    optimized_qasm: str,
+    skipped: bool,
+) -> dict:
+    """Build the original-vs-optimised comparison report."""
+    depth_original = circuit.depth()
+    count_original = circuit.count_ops()
+    depth_optimized = optimized.depth()
+    count_optimized = optimized.count_ops()
+
+    # Same total as summing count_ops(), without iterating the dict again
+    total_orig = len(circuit.data)
+    total_opt = len(optimized.data)
+
+    return {
+        "original_depth": depth_original,
+        "optimized_depth": depth_optimized,
+        "original_ops": count_original,
+        "optimized_ops": count_optimized,
+        "optimized_qasm": optimized_qasm,
+        "improvement_msg": (
+            f"Reduced depth from {depth_original} to {depth_optimized}. "
+            f"Gates: {total_orig} → {total_opt}"
+        ),
+        "skipped": skipped,
+    }
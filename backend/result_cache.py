@@ -0,0 +1,119 @@
+"""
+result_cache.py — Content-addressed on-disk cache for algorithm results.
+
+VQE / QAOA runs are expensive (a full classical optimisation loop) and the
+frontend frequently re-submits identical problems.  Results are pickled to
+``<cache_dir>/<namespace>/<blake2b(inputs)>.pkl`` so a repeat request is a
+single file read.
+
+The cache root defaults to ``~/.qcd_cache`` and can be overridden with the
+``QCD_CACHE_DIR`` environment variable.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+DEFAULT_TTL = 7 * 24 * 3600  # one week, in seconds
+PRUNE_INTERVAL = 3600  # minimum seconds between directory scans
+
+
+class ResultCache:
+    """
+    A small pickle-per-entry disk cache keyed on JSON-serialisable inputs.
+
+    Args:
+        namespace: Sub-directory name separating unrelated result types
+                   (e.g. ``"vqe"``, ``"qaoa"``).
+        ttl:       Entry lifetime in seconds; older entries are treated as
+                   misses.
+    """
+
+    def __init__(self, namespace: str, ttl: int = DEFAULT_TTL):
+        root = os.environ.get("QCD_CACHE_DIR", "~/.qcd_cache")
+        self.directory = Path(root).expanduser() / namespace
+        self.ttl = ttl
+        self._last_prune = 0.0
+
+    @staticmethod
+    def make_key(*inputs: Any) -> str:
+        """Hash the given inputs into a stable hex cache key."""
+        blob = json.dumps(inputs, sort_keys=True, default=str).encode()
+        return hashlib.blake2b(blob, digest_size=20).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.pkl"
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Return the cached value for *key*, or ``None`` on miss / expiry.
+
+        Expired or unreadable entries are deleted.  Any failure to load counts
+        as a miss: a pickle written by older code or library versions can
+        raise ``ModuleNotFoundError``, ``AttributeError`` and the like.
+        """
+        path = self._path(key)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl:
+                path.unlink(missing_ok=True)
+                return None
+            with path.open("rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            try:
+                path.unlink(missing_ok=True)
+            except OSError:
+                pass
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store *value* under *key*.  Failures to write are ignored.
+
+        Expired entries are pruned at most once per ``PRUNE_INTERVAL``.
+        """
+        tmp = None
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file then rename so readers never see a
+            # partially-written entry.
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self._path(key))
+            tmp = None
+        except Exception:
+            # Disk errors, but also values that cannot be pickled
+            pass
+        finally:
+            if tmp is not None:
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
+
+        now = time.time()
+        if now - self._last_prune >= PRUNE_INTERVAL:
+            self._last_prune = now
+            self._prune()
+
+    def _prune(self) -> None:
+        """Delete expired entries (and temp files left by crashed writers)."""
+        cutoff = time.time() - self.ttl
+        try:
+            entries = list(self.directory.iterdir())
+        except OSError:
+            return
+        for path in entries:
+            try:
+                if path.suffix in (".pkl", ".tmp") and path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except OSError:
+                pass
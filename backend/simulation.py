@@ -9,19 +9,282 @@ Provides functions to:
   • Construct standard QFT (Quantum Fourier Transform) circuits.
 """
 
+import asyncio
+import base64
+import functools
+import hashlib
+import io
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor, ThreadPoolExecutor
+
+import matplotlib
+
+matplotlib.use("Agg")  # Non-interactive backend for server-side rendering
+# A bare Figure (not pyplot) so concurrent renders share no global state
+from matplotlib.figure import Figure
 from qiskit import QuantumCircuit, transpile
+from qiskit.circuit import CircuitInstruction, Gate, Qubit
+from qiskit.circuit.exceptions import CircuitError
+from qiskit.circuit.library import (
+    CCXGate,
+    CHGate,
+    CPhaseGate,
+    CRXGate,
+    CRYGate,
+    CRZGate,
+    CSwapGate,
+    CXGate,
+    CYGate,
+    CZGate,
+    HGate,
+    RXGate,
+    RYGate,
+    RZGate,
+    SGate,
+    SwapGate,
+    TGate,
+    XGate,
+    YGate,
+    ZGate,
+)
+from qiskit.visualization import plot_bloch_vector
 from qiskit_aer import AerSimulator
 import numpy as np
-from typing import List, Dict, Any
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Type, Union
 
+try:  # Optional: JIT-compiles the Bloch vector kernel
+    from numba import njit
+except ImportError:
+    njit = None
+
+# ---------------------------------------------------------------------------
+# Shared simulator instances
 # ---------------------------------------------------------------------------
-# Supported gate name → handler mapping reference
+# Constructing an AerSimulator parses its configuration and sets up thread
+# pools (and, on GPU builds, device contexts), so one instance per method is
+# built on first use and then reused by every caller in the process —
+# including the algorithm modules running in the worker pool.
+
+_SIM_COUNTS: Optional[AerSimulator] = None
+_SIM_SV: Optional[AerSimulator] = None
+_SIM_SV_GPU: Optional[AerSimulator] = None
+_SIM_LOCK = threading.Lock()
+
+# Statevectors of at least this many qubits go to the GPU when one is
+# available; below it, kernel-launch and transfer overhead outweigh the gain.
+GPU_THRESHOLD = int(os.environ.get("QCD_GPU_THRESHOLD", "14"))
+
+
+def get_counts_simulator() -> AerSimulator:
+    """Return the shared sampling (measurement-counts) simulator."""
+    global _SIM_COUNTS
+    if _SIM_COUNTS is None:
+        with _SIM_LOCK:
+            if _SIM_COUNTS is None:
+                _SIM_COUNTS = AerSimulator(
+                    method="automatic",
+                    max_parallel_threads=os.cpu_count(),
+                    statevector_parallel_threshold=12,
+                )
+    return _SIM_COUNTS
+
+
+@functools.lru_cache(maxsize=None)
+def has_gpu() -> bool:
+    """Whether this Aer build can simulate on a GPU (probed once)."""
+    return "GPU" in AerSimulator().available_devices()
+
+
+def get_sv_simulator(num_qubits: Optional[int] = None) -> AerSimulator:
+    """
+    Return the shared statevector simulator.
+
+    It runs in single precision: amplitudes only feed probabilities, Bloch
+    vectors and JSON output, where complex64 is ample, and it halves the
+    memory traffic of the ``2**n`` state.
+
+    Args:
+        num_qubits: Width of the circuit to be run.  At ``GPU_THRESHOLD``
+                    qubits or more, a GPU-backed (cuStateVec) simulator is
+                    returned instead when the Aer build supports one.
+    """
+    global _SIM_SV, _SIM_SV_GPU
+    if num_qubits is not None and num_qubits >= GPU_THRESHOLD and has_gpu():
+        if _SIM_SV_GPU is None:
+            with _SIM_LOCK:
+                if _SIM_SV_GPU is None:
+                    _SIM_SV_GPU = AerSimulator(
+                        method="statevector",
+                        device="GPU",
+                        cuStateVec_enable=True,
+                        precision="single",
+                    )
+        return _SIM_SV_GPU
+
+    if _SIM_SV is None:
+        with _SIM_LOCK:
+            if _SIM_SV is None:
+                _SIM_SV = AerSimulator(
+                    method="statevector",
+                    precision="single",
+                    max_parallel_threads=os.cpu_count(),
+                )
+    return _SIM_SV
+
+
+@functools.lru_cache(maxsize=None)
+def _native_ops(simulator: AerSimulator) -> frozenset:
+    """Instruction names *simulator* executes without transpilation."""
+    return frozenset(simulator.target.operation_names) | {"barrier"}
+
+
+# Transpiled circuits, keyed on (simulator, structural digest).  The same
+# circuit is often re-submitted (new shot count, or a statevector request
+# followed by a Bloch request), and those repeats skip the transpiler.
+_COMPILE_CACHE_SIZE = 256
+_compile_cache: "OrderedDict[tuple, QuantumCircuit]" = OrderedDict()
+_compile_cache_lock = threading.Lock()
+
+
+def _compile(circuit: QuantumCircuit, simulator: AerSimulator) -> QuantumCircuit:
+    """
+    Transpile *circuit* for *simulator*, unless it is already native.
+
+    Circuits built from the debugger's gate set are almost always made of
+    instructions Aer runs directly, and for small circuits ``transpile``'s
+    fixed cost dominates the whole simulation.  Other circuits are looked up
+    in a small LRU of earlier transpilations first.  The result may be a
+    shared object: callers must not mutate it.
+    """
+    if circuit.count_ops().keys() <= _native_ops(simulator):
+        return circuit
+
+    key = (id(simulator), _structure_digest(circuit))
+    with _compile_cache_lock:
+        if key in _compile_cache:
+            _compile_cache.move_to_end(key)
+            return _compile_cache[key]
+
+    compiled = transpile(circuit, simulator)
+
+    with _compile_cache_lock:
+        _compile_cache[key] = compiled
+        if len(_compile_cache) > _COMPILE_CACHE_SIZE:
+            _compile_cache.popitem(last=False)
+    return compiled
+
+
+def _structure_digest(circuit: QuantumCircuit) -> bytes:
+    """Hash of a circuit's width and exact instruction sequence."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(repr((circuit.num_qubits, circuit.num_clbits)).encode())
+    for inst in circuit.data:
+        h.update(
+            repr((
+                inst.operation.name,
+                [circuit.find_bit(q).index for q in inst.qubits],
+                [circuit.find_bit(c).index for c in inst.clbits],
+                inst.operation.params,
+            )).encode()
+        )
+    return h.digest()
+
+
 # ---------------------------------------------------------------------------
-# Single-qubit:  H, X, Y, Z, S, T, RX(θ), RY(θ), RZ(θ)
-# Two-qubit:     CNOT/CX, CY, CZ, CH, SWAP, CRX(θ), CRY(θ), CRZ(θ), CP(θ)
-# Three-qubit:   CCX (Toffoli), CSWAP (Fredkin)
-# Measurement:   M
+# Gate dispatch table
 # ---------------------------------------------------------------------------
+# Gate name → (minimum qubit count, handler(qc, bits, qubits, params)).
+# Multi-qubit gates given too few qubits are skipped; single-qubit gates
+# (minimum 0) index ``qubits[0]`` directly, so a missing qubit still raises.
+# Parameterised gates default to θ = π/2 when no angle is supplied.
+#
+# Handlers append ``CircuitInstruction``s straight onto the circuit data as
+# Qiskit's native standard gates, skipping the ``qc.h(...)`` sugar's argument
+# broadcasting and the Python ``Gate`` objects parameterised gates would
+# otherwise construct; ``_qargs`` keeps the index checks that path did.
+# ``_append(..., _standard_gate=True)``, ``Gate._standard_gate`` and
+# ``CircuitInstruction.from_standard`` are Qiskit internals, which is why
+# requirements.txt pins qiskit to the tested 2.x series.
+
+_DEFAULT_THETA = np.pi / 2
+
+
+def _theta(params: List[float]) -> float:
+    return params[0] if params else _DEFAULT_THETA
+
+
+def _qargs(bits: List[Qubit], qubits: List[int], n: int) -> Tuple[Qubit, ...]:
+    """Resolve the first *n* of *qubits* to the circuit's ``Qubit`` objects."""
+    idx = qubits[0] if n == 1 else qubits[:n]
+    try:
+        if n == 1:
+            return (bits[idx],)
+        qargs = tuple([bits[i] for i in idx])
+    except (IndexError, TypeError):
+        raise CircuitError(
+            f"Invalid qubit index {idx} for a circuit of {len(bits)} qubits."
+        ) from None
+    if len(set(qargs)) < n:
+        raise CircuitError("duplicate qubit arguments")
+    return qargs
+
+
+_GateHandler = Callable[[QuantumCircuit, List[Qubit], List[int], List[float]], Any]
+
+
+def _fixed(gate_cls: Type[Gate]) -> _GateHandler:
+    std, n = gate_cls._standard_gate, gate_cls._standard_gate.num_qubits
+    return lambda qc, bits, q, p: qc._append(
+        CircuitInstruction.from_standard(std, _qargs(bits, q, n), ()),
+        _standard_gate=True,
+    )
+
+
+def _rotation(gate_cls: Type[Gate]) -> _GateHandler:
+    std, n = gate_cls._standard_gate, gate_cls._standard_gate.num_qubits
+    return lambda qc, bits, q, p: qc._append(
+        CircuitInstruction.from_standard(
+            std, _qargs(bits, q, n), (float(_theta(p)),)
+        ),
+        _standard_gate=True,
+    )
+
+
+_GATE_DISPATCH: Dict[str, Tuple[int, _GateHandler]] = {
+    # Single-qubit gates (no parameters)
+    "H": (0, _fixed(HGate)),
+    "X": (0, _fixed(XGate)),
+    "Y": (0, _fixed(YGate)),
+    "Z": (0, _fixed(ZGate)),
+    "S": (0, _fixed(SGate)),
+    "T": (0, _fixed(TGate)),
+    # Single-qubit rotation gates (one θ parameter)
+    "RX": (0, _rotation(RXGate)),
+    "RY": (0, _rotation(RYGate)),
+    "RZ": (0, _rotation(RZGate)),
+    # Two-qubit gates (no parameters)
+    "CNOT": (2, _fixed(CXGate)),
+    "CX": (2, _fixed(CXGate)),
+    "CY": (2, _fixed(CYGate)),
+    "CZ": (2, _fixed(CZGate)),
+    "CH": (2, _fixed(CHGate)),
+    "SWAP": (2, _fixed(SwapGate)),
+    # Two-qubit controlled rotation gates (one θ parameter)
+    "CRX": (2, _rotation(CRXGate)),
+    "CRY": (2, _rotation(CRYGate)),
+    "CRZ": (2, _rotation(CRZGate)),
+    # Controlled-Phase gate — used internally by QFT
+    "CP": (2, _rotation(CPhaseGate)),
+    # Three-qubit gates
+    "CCX": (3, _fixed(CCXGate)),
+    "TOFFOLI": (3, _fixed(CCXGate)),
+    "CSWAP": (3, _fixed(CSwapGate)),
+    "FREDKIN": (3, _fixed(CSwapGate)),
+    # Measurement
+    "M": (0, lambda qc, bits, q, p: qc.measure_all()),
+}
 
 
 def build_circuit(num_qubits: int, gates: List[Dict[str, Any]]) -> QuantumCircuit:
@@ -44,223 +307,431 @@ def build_circuit(num_qubits: int, gates: List[Dict[str, Any]]) -> QuantumCircui
         ValueError: If a gate references a qubit index outside ``[0, num_qubits)``.
     """
     qc = QuantumCircuit(num_qubits)
+    bits = qc.qubits
 
     for gate in gates:
         name = gate.get("name", "").upper()
         qubits = gate.get("qubits", [])
         params = gate.get("params", []) or []
 
-        # --- Single-qubit gates (no parameters) --------------------------
-        if name == "H":
-            qc.h(qubits[0])
-        elif name == "X":
-            qc.x(qubits[0])
-        elif name == "Y":
-            qc.y(qubits[0])
-        elif name == "Z":
-            qc.z(qubits[0])
-        elif name == "S":
-            qc.s(qubits[0])
-        elif name == "T":
-            qc.t(qubits[0])
-
-        # --- Single-qubit rotation gates (one θ parameter) ----------------
-        elif name == "RX":
-            theta = params[0] if params else np.pi / 2
-            qc.rx(theta, qubits[0])
-        elif name == "RY":
-            theta = params[0] if params else np.pi / 2
-            qc.ry(theta, qubits[0])
-        elif name == "RZ":
-            theta = params[0] if params else np.pi / 2
-            qc.rz(theta, qubits[0])
-
-        # --- Two-qubit gates (no parameters) ------------------------------
-        elif name in ("CNOT", "CX"):
-            if len(qubits) >= 2:
-                qc.cx(qubits[0], qubits[1])
-        elif name == "CY":
-            if len(qubits) >= 2:
-                qc.cy(qubits[0], qubits[1])
-        elif name == "CZ":
-            if len(qubits) >= 2:
-                qc.cz(qubits[0], qubits[1])
-        elif name == "CH":
-            if len(qubits) >= 2:
-                qc.ch(qubits[0], qubits[1])
-        elif name == "SWAP":
-            if len(qubits) >= 2:
-                qc.swap(qubits[0], qubits[1])
-
-        # --- Two-qubit controlled rotation gates (one θ parameter) --------
-        elif name == "CRX":
-            theta = params[0] if params else np.pi / 2
-            if len(qubits) >= 2:
-                qc.crx(theta, qubits[0], qubits[1])
-        elif name == "CRY":
-            theta = params[0] if params else np.pi / 2
-            if len(qubits) >= 2:
-                qc.cry(theta, qubits[0], qubits[1])
-        elif name == "CRZ":
-            theta = params[0] if params else np.pi / 2
-            if len(qubits) >= 2:
-                qc.crz(theta, qubits[0], qubits[1])
-        elif name == "CP":
-            # Controlled-Phase gate — used internally by QFT
-            theta = params[0] if params else np.pi / 2
-            if len(qubits) >= 2:
-                qc.cp(theta, qubits[0], qubits[1])
-
-        # --- Three-qubit gates --------------------------------------------
-        elif name in ("CCX", "TOFFOLI"):
-            if len(qubits) >= 3:
-                qc.ccx(qubits[0], qubits[1], qubits[2])
-        elif name in ("CSWAP", "FREDKIN"):
-            if len(qubits) >= 3:
-                qc.cswap(qubits[0], qubits[1], qubits[2])
-
-        # --- Measurement --------------------------------------------------
-        elif name == "M":
-            qc.measure_all()
-
-        # Unknown gates are silently skipped (logged in production)
+        entry = _GATE_DISPATCH.get(name)
+        if entry is None:
+            continue  # Unknown gates are silently skipped (logged in production)
+        min_qubits, apply = entry
+        if len(qubits) >= min_qubits:
+            apply(qc, bits, qubits, params)
 
     return qc
 
 
-def run_circuit(circuit: QuantumCircuit, shots: int = 1024) -> Dict[str, Any]:
+def run_circuit(
+    circuit: Union[QuantumCircuit, str], shots: int = 1024, sparse: bool = False
+) -> Dict[str, Any]:
     """
     Execute a ``QuantumCircuit`` on the Aer ``qasm_simulator`` backend.
 
     If the circuit does not already contain classical bits (measurements),
     ``measure_all()`` is applied automatically so that counts can be returned.
+    OpenQASM strings are dispatched to :func:`run_qasm`, circuits to
+    :func:`run_qc`; callers that know which they hold can call those directly.
 
     Args:
-        circuit: The circuit to execute.
+        circuit: The circuit (or OpenQASM 2.0 source) to execute.
         shots:   Number of measurement repetitions.
+        sparse:  Return the histogram as two parallel integer arrays
+                 instead of a bitstring-keyed dict.
 
     Returns:
-        ``{"counts": {...}}`` on success, or ``{"error": "..."}`` on failure.
+        ``{"counts": {...}}`` (or ``{"count_keys": [...], "count_values":
+        [...]}`` when *sparse*) on success, or ``{"error": "..."}`` on failure.
     """
-    try:
-        if not isinstance(circuit, QuantumCircuit):
-            circuit = QuantumCircuit.from_qasm_str(circuit)
+    if isinstance(circuit, str):
+        return run_qasm(circuit, shots=shots, sparse=sparse)
+    return run_qc(circuit, shots=shots, sparse=sparse)
 
-        simulator = AerSimulator()
 
-        # Append measurements when none are present
-        if not circuit.clbits:
-            circuit.measure_all()
+def run_qc(
+    circuit: QuantumCircuit, shots: int = 1024, sparse: bool = False
+) -> Dict[str, Any]:
+    """Execute an in-memory circuit; as :func:`run_circuit`, without parsing."""
+    return _run_batch([circuit], shots, sparse)[0]
 
-        compiled = transpile(circuit, simulator)
-        result = simulator.run(compiled, shots=shots).result()
-        counts = result.get_counts(circuit)
-        return {"counts": counts}
+
+def run_qasm(qasm: str, shots: int = 1024, sparse: bool = False) -> Dict[str, Any]:
+    """Parse OpenQASM 2.0 source and execute it as :func:`run_circuit`."""
+    try:
+        circuit = QuantumCircuit.from_qasm_str(qasm)
     except Exception as e:
         return {"error": str(e)}
+    return run_qc(circuit, shots=shots, sparse=sparse)
 
 
-def get_statevector(circuit: QuantumCircuit) -> Dict[str, Any]:
+def run_circuits(
+    circuits: List[Union[QuantumCircuit, str]],
+    shots: int = 1024,
+    sparse: bool = False,
+) -> List[Dict[str, Any]]:
     """
-    Simulate the circuit and return the final statevector *before* measurement.
+    Execute several circuits in a single Aer job.
 
-    Measurements are stripped from a copy of the circuit so that the
-    statevector is not collapsed.
+    One ``simulator.run`` call amortises Aer's per-job setup across the whole
+    batch, and Aer may run the experiments in parallel.  Each circuit is
+    prepared exactly as in :func:`run_circuit`.
 
     Args:
-        circuit: The circuit to simulate.
+        circuits: The circuits (or OpenQASM strings) to execute.
+        shots:    Measurement repetitions per circuit.
+        sparse:   As for :func:`run_circuit`.
 
     Returns:
-        ``{"statevector": [[real, imag], ...]}`` on success, or
-        ``{"error": "..."}`` on failure.
+        One :func:`run_circuit`-style result dict per circuit, in order.  If
+        the batch fails, every entry is ``{"error": "..."}``.
     """
     try:
-        if not isinstance(circuit, QuantumCircuit):
-            circuit = QuantumCircuit.from_qasm_str(circuit)
+        parsed = [
+            c if isinstance(c, QuantumCircuit) else QuantumCircuit.from_qasm_str(c)
+            for c in circuits
+        ]
+    except Exception as e:
+        return [{"error": str(e)} for _ in circuits]
+    return _run_batch(parsed, shots, sparse)
+
+
+def _run_batch(
+    circuits: List[QuantumCircuit], shots: int, sparse: bool
+) -> List[Dict[str, Any]]:
+    """Run already-parsed circuits as one Aer job (see :func:`run_circuits`)."""
+    try:
+        simulator = get_counts_simulator()
+
+        compiled = []
+        for circuit in circuits:
+            # Append measurements when none are present
+            if not circuit.clbits:
+                circuit.measure_all()
+
+            compiled.append(_compile(circuit, simulator))
+
+        result = simulator.run(compiled, shots=shots).result()
+
+        outputs: List[Dict[str, Any]] = []
+        for i in range(len(compiled)):
+            if sparse:
+                # Aer's raw counts are keyed by the classical register value
+                # in hex, so no bitstrings are formatted at all
+                raw = result.data(i)["counts"]
+                outputs.append({
+                    "count_keys": [int(k, 16) for k in raw],
+                    "count_values": list(raw.values()),
+                })
+            else:
+                outputs.append({"counts": result.get_counts(i)})
+        return outputs
+    except Exception as e:
+        return [{"error": str(e)} for _ in circuits]
+
+
+def simulate_statevector(
+    circuit: QuantumCircuit, assume_no_measurements: bool = False
+) -> np.ndarray:
+    """
+    Simulate the circuit and return the raw final statevector array.
 
-        simulator = AerSimulator(method="statevector")
+    Measurements are stripped from a copy of the circuit so that the
+    statevector is not collapsed.  Unlike :func:`get_statevector`, errors
+    are raised rather than returned.
+
+    Args:
+        circuit:                The circuit to simulate.
+        assume_no_measurements: The caller does not mind the circuit being
+                                used in place.  If it also has no classical
+                                bits, the copy is skipped: the save
+                                instruction is appended to *circuit* and
+                                removed again after the run.
 
+    Returns:
+        A contiguous complex ``np.ndarray`` of length ``2**num_qubits``,
+        the simulator's own buffer (no copy is made).
+    """
+    simulator = get_sv_simulator(circuit.num_qubits)
+
+    if assume_no_measurements and not circuit.clbits:
+        circuit.save_statevector()
+        try:
+            compiled = _compile(circuit, simulator)
+            result = simulator.run(compiled).result()
+        finally:
+            circuit.data.pop()
+    else:
         # Work on a copy so the original circuit is not mutated
         circuit_sv = circuit.copy()
         circuit_sv.remove_final_measurements()
         circuit_sv.save_statevector()
 
-        compiled = transpile(circuit_sv, simulator)
+        compiled = _compile(circuit_sv, simulator)
         result = simulator.run(compiled).result()
-        statevector = result.get_statevector(circuit_sv)
+    return np.ascontiguousarray(result.get_statevector(0).data)
+
+
+def get_statevector(
+    circuit: QuantumCircuit,
+    assume_no_measurements: bool = False,
+    encoding: Literal["json", "float32_b64"] = "json",
+) -> Dict[str, Any]:
+    """
+    Simulate the circuit and return the final statevector *before* measurement.
+
+    Args:
+        circuit:                The circuit to simulate.
+        assume_no_measurements: As for :func:`simulate_statevector`.
+        encoding:               ``"json"`` for ``[real, imag]`` float pairs;
+                                ``"float32_b64"`` for the amplitudes as one
+                                Base64 string of little-endian ``float32``
+                                (real, imag) pairs — half the bytes, and no
+                                per-amplitude Python floats.
 
-        # Serialise complex amplitudes as [real, imag] pairs for JSON transport
-        sv_list = [[amp.real, amp.imag] for amp in np.asarray(statevector)]
-        return {"statevector": sv_list}
+    Returns:
+        ``{"statevector": [[real, imag], ...]}`` or, for ``"float32_b64"``,
+        ``{"statevector_b64": str, "shape": [2**n, 2], "dtype": "float32"}``
+        on success; ``{"error": "..."}`` on failure.
+    """
+    try:
+        statevector = simulate_statevector(circuit, assume_no_measurements)
+        if encoding == "float32_b64":
+            pairs = statevector.astype("<c8", copy=False).view("<f4")
+            return {
+                "statevector_b64": base64.b64encode(pairs.tobytes()).decode("ascii"),
+                "shape": [statevector.size, 2],
+                "dtype": "float32",
+            }
+        return {"statevector": _statevector_pairs(statevector)}
     except Exception as e:
         return {"error": str(e)}
 
 
-def get_bloch_image(circuit: QuantumCircuit) -> Dict[str, Any]:
+# Qubit count from which Bloch rendering moves to a process pool, if the
+# caller supplies one; below it, process start-up and pickling cost more than
+# the GIL does.
+BLOCH_PROCESS_THRESHOLD = int(os.environ.get("QCD_BLOCH_PROCESS_THRESHOLD", "8"))
+
+
+def get_bloch_image(
+    circuit: QuantumCircuit,
+    binary: bool = False,
+    assume_no_measurements: bool = False,
+) -> Dict[str, Any]:
     """
     Generate per-qubit Bloch sphere PNG images encoded as Base64 strings.
 
-    For each qubit the reduced density matrix is computed via partial tracing,
-    and the Bloch vector ``(⟨X⟩, ⟨Y⟩, ⟨Z⟩)`` is extracted.
+    Every qubit's Bloch vector ``(⟨X⟩, ⟨Y⟩, ⟨Z⟩)`` is read straight off the
+    statevector (see :func:`bloch_vectors`).  Qubits are split into runs
+    rendered concurrently on a small thread pool; each worker draws its
+    whole run on one reused figure.  See :func:`get_bloch_image_async` for
+    the event-loop version, which can render on a process pool.
 
     Args:
         circuit: The circuit to simulate.
+        binary:  Return raw PNG ``bytes`` instead of Base64 strings.
+        assume_no_measurements: As for :func:`simulate_statevector`.
 
     Returns:
-        ``{"bloch_images": [base64_str, ...]}`` on success, or
-        ``{"error": "..."}`` on failure.
+        ``{"bloch_images": [base64_str, ...]}`` (``bytes`` items when
+        *binary*) on success, or ``{"error": "..."}`` on failure.
     """
     try:
-        if not isinstance(circuit, QuantumCircuit):
-            circuit = QuantumCircuit.from_qasm_str(circuit)
+        statevector = simulate_statevector(circuit, assume_no_measurements)
+        return {
+            "bloch_images": _bloch_images(statevector, circuit.num_qubits, binary)
+        }
+    except Exception as e:
+        return {"error": str(e)}
 
-        simulator = AerSimulator(method="statevector")
 
-        circuit_sv = circuit.copy()
-        circuit_sv.remove_final_measurements()
-        circuit_sv.save_statevector()
+def get_statevector_and_bloch(
+    circuit: QuantumCircuit,
+    binary: bool = False,
+    assume_no_measurements: bool = False,
+) -> Dict[str, Any]:
+    """
+    :func:`get_statevector` and :func:`get_bloch_image` from one simulation.
 
-        compiled = transpile(circuit_sv, simulator)
-        result = simulator.run(compiled).result()
-        statevector = result.get_statevector(circuit_sv)
+    The circuit is simulated once and the same statevector buffer feeds both
+    the JSON amplitude pairs and the Bloch vectors.  Arguments are as for
+    :func:`get_bloch_image`.
+
+    Returns:
+        ``{"statevector": [...], "bloch_images": [...]}`` on success, or
+        ``{"error": "..."}`` on failure.
+    """
+    try:
+        statevector = simulate_statevector(circuit, assume_no_measurements)
+        return {
+            "statevector": _statevector_pairs(statevector),
+            "bloch_images": _bloch_images(statevector, circuit.num_qubits, binary),
+        }
+    except Exception as e:
+        return {"error": str(e)}
 
-        from qiskit.visualization import plot_bloch_vector
-        from qiskit.quantum_info import partial_trace
-        import io
-        import base64
-        import matplotlib
-        matplotlib.use("Agg")  # Non-interactive backend for server-side rendering
-        import matplotlib.pyplot as plt
 
+async def get_bloch_image_async(
+    circuit: QuantumCircuit,
+    binary: bool = False,
+    assume_no_measurements: bool = False,
+    executor: Optional[Executor] = None,
+    include_statevector: bool = False,
+) -> Dict[str, Any]:
+    """
+    :func:`get_bloch_image` for use inside the event loop.
+
+    Simulation and thread-pool rendering run in the loop's default executor,
+    so the loop keeps serving other requests.  From
+    ``BLOCH_PROCESS_THRESHOLD`` qubits the runs are instead awaited on
+    *executor*, if one is given: matplotlib's drawing is largely pure
+    Python, so threads mostly wait on the GIL.
+
+    With *include_statevector*, the result also carries ``"statevector"``
+    pairs taken from the same simulation (as :func:`get_statevector_and_bloch`).
+    """
+    loop = asyncio.get_running_loop()
+    try:
         num_qubits = circuit.num_qubits
-        bloch_images: List[str] = []
-
-        for i in range(num_qubits):
-            # Trace out every qubit except qubit i
-            trace_indices = [j for j in range(num_qubits) if j != i]
-            rho = partial_trace(statevector, trace_indices)
-
-            # Extract Bloch vector from the 2×2 density matrix
-            dm = rho.data
-            x = float(np.real(dm[0, 1] + dm[1, 0]))
-            y = float(np.real(1j * (dm[0, 1] - dm[1, 0])))
-            z = float(np.real(dm[0, 0] - dm[1, 1]))
-
-            fig = plt.figure(figsize=(3, 3))
-            ax = fig.add_subplot(111, projection="3d")
-            plot_bloch_vector([x, y, z], ax=ax, title=f"Qubit {i}")
-
-            buf = io.BytesIO()
-            fig.savefig(buf, format="png", bbox_inches="tight", transparent=True)
-            buf.seek(0)
-            bloch_images.append(base64.b64encode(buf.read()).decode("utf-8"))
-            plt.close(fig)
-
-        return {"bloch_images": bloch_images}
+        if executor is None or num_qubits < BLOCH_PROCESS_THRESHOLD:
+            fn = get_statevector_and_bloch if include_statevector else get_bloch_image
+            return await loop.run_in_executor(
+                None, functools.partial(fn, circuit, binary, assume_no_measurements)
+            )
+
+        statevector = await loop.run_in_executor(
+            None, simulate_statevector, circuit, assume_no_measurements
+        )
+        runs = _bloch_runs(bloch_vectors(statevector, num_qubits))
+        rendered = await asyncio.gather(
+            *(loop.run_in_executor(executor, _render_bloch_run, run) for run in runs)
+        )
+        images: List[Any] = [image for run in rendered for image in run]
+        result = {"bloch_images": images if binary else _b64_all(images)}
+        if include_statevector:
+            result["statevector"] = _statevector_pairs(statevector)
+        return result
     except Exception as e:
         return {"error": str(e)}
 
 
+def _statevector_pairs(statevector: np.ndarray) -> List[List[float]]:
+    """Serialise complex amplitudes as ``[real, imag]`` pairs for JSON."""
+    # Viewing the complex buffer as interleaved floats lets one C-level
+    # tolist() build every pair
+    return statevector.view(statevector.real.dtype).reshape(-1, 2).tolist()
+
+
+def _bloch_images(
+    statevector: np.ndarray, num_qubits: int, binary: bool
+) -> List[Any]:
+    """Render every qubit's Bloch sphere as PNG bytes (or Base64 strings)."""
+    runs = _bloch_runs(bloch_vectors(statevector, num_qubits))
+    with ThreadPoolExecutor(max_workers=len(runs)) as pool:
+        images: List[Any] = [
+            image for run in pool.map(_render_bloch_run, runs) for image in run
+        ]
+    return images if binary else _b64_all(images)
+
+
+def _bloch_runs(vectors: np.ndarray) -> List[List[Tuple[int, List[float]]]]:
+    """Split the qubits into contiguous runs, one per CPU."""
+    # Contiguous, so rendered runs concatenate back in qubit order
+    items = list(enumerate(vectors.tolist()))
+    workers = max(1, min(len(items), os.cpu_count() or 1))
+    size = -(-len(items) // workers)
+    return [items[k:k + size] for k in range(0, len(items), size)]
+
+
+def _b64_all(images: List[bytes]) -> List[str]:
+    return [base64.b64encode(png).decode("utf-8") for png in images]
+
+
+def bloch_vectors(statevector: np.ndarray, num_qubits: int) -> np.ndarray:
+    """
+    Compute every qubit's Bloch vector directly from a pure statevector.
+
+    With the amplitudes split by qubit *i* into ``a0`` (bit 0) and ``a1``
+    (bit 1), the reduced density matrix is ``[[Σ|a0|², Σa0·a1*], [·, Σ|a1|²]]``,
+    so each vector costs one O(2**n) pass — no ``partial_trace`` and no
+    intermediate density matrices.  The passes run as one JIT-compiled loop
+    when numba is installed.
+
+    Returns:
+        An ``(num_qubits, 3)`` array of ``(x, y, z)`` rows, qubit 0 first.
+    """
+    if _bloch_all is not None:
+        return _bloch_all(np.ascontiguousarray(statevector).ravel(), num_qubits)
+
+    # Qiskit is little-endian: qubit i is axis n-1-i of the C-order tensor
+    psi = np.asarray(statevector).reshape((2,) * num_qubits)
+    vectors = np.empty((num_qubits, 3))
+    for i in range(num_qubits):
+        a = np.moveaxis(psi, num_qubits - 1 - i, 0).reshape(2, -1)
+        rho01 = np.vdot(a[1], a[0])  # Σ a0·conj(a1)
+        vectors[i] = (
+            2 * rho01.real,
+            -2 * rho01.imag,
+            np.vdot(a[0], a[0]).real - np.vdot(a[1], a[1]).real,
+        )
+    return vectors
+
+
+def _bloch_all_py(psi: np.ndarray, num_qubits: int) -> np.ndarray:
+    """Numba kernel for :func:`bloch_vectors`; qubit *q* is index bit *q*."""
+    vectors = np.empty((num_qubits, 3))
+    for q in range(num_qubits):
+        mask = 1 << q
+        x = y = z = 0.0
+        # Blocks of 2·mask amplitudes: the first half has bit q clear (a0),
+        # the second half is the same states with bit q set (a1)
+        for base in range(0, psi.size, 2 * mask):
+            for i in range(base, base + mask):
+                a0 = psi[i]
+                a1 = psi[i + mask]
+                rho01 = a0 * np.conj(a1)
+                x += rho01.real
+                y += rho01.imag
+                z += (a0.real * a0.real + a0.imag * a0.imag
+                      - a1.real * a1.real - a1.imag * a1.imag)
+        vectors[q, 0] = 2 * x
+        vectors[q, 1] = -2 * y
+        vectors[q, 2] = z
+    return vectors
+
+
+# Serial on purpose: numba's default threading layer must not be entered
+# from several threads at once, and requests render concurrently.
+_bloch_all = (
+    njit(cache=True, fastmath=True)(_bloch_all_py) if njit is not None else None
+)
+
+
+def _render_bloch_run(run: List[Tuple[int, List[float]]]) -> List[bytes]:
+    """
+    Render ``(qubit, vector)`` pairs as PNG Bloch spheres.
+
+    One figure, 3-D axes and buffer are built per run and cleared between
+    qubits rather than rebuilt for each one.
+    """
+    fig = Figure(figsize=(3, 3))
+    ax = fig.add_subplot(111, projection="3d")
+    buf = io.BytesIO()
+
+    images: List[bytes] = []
+    for qubit, vector in run:
+        ax.clear()
+        plot_bloch_vector(vector, ax=ax, title=f"Qubit {qubit}")
+
+        buf.seek(0)
+        buf.truncate()
+        fig.savefig(buf, format="png", bbox_inches="tight", transparent=True)
+        images.append(buf.getvalue())
+    return images
+
+
 # ---------------------------------------------------------------------------
 # Quantum Fourier Transform (QFT)
 # ---------------------------------------------------------------------------
@@ -286,9 +757,21 @@ def build_qft_circuit(num_qubits: int, inverse: bool = False) -> QuantumCircuit:
         num_qubits: Number of qubits for the QFT.
         inverse:    If ``True``, build the inverse QFT (QFT†).
 
+    Each ``(num_qubits, inverse)`` circuit is built once and copied out of a
+    small cache, so the caller may modify the result freely.
+
     Returns:
         A ``QuantumCircuit`` implementing the (inverse) QFT.
     """
+    return _qft_template(num_qubits, inverse).copy()
+
+
+@functools.lru_cache(maxsize=64)
+def _qft_template(num_qubits: int, inverse: bool) -> QuantumCircuit:
+    """Build the shared (inverse) QFT circuit; never mutate the result."""
+    if inverse:
+        return _build_inverse_qft_circuit(num_qubits)
+
     qc = QuantumCircuit(num_qubits, name="QFT")
 
     for j in range(num_qubits):
@@ -302,8 +785,24 @@ def build_qft_circuit(num_qubits: int, inverse: bool = False) -> QuantumCircuit:
     for i in range(num_qubits // 2):
         qc.swap(i, num_qubits - 1 - i)
 
-    if inverse:
-        qc = qc.inverse()
-        qc.name = "QFT†"
+    return qc
+
+
+def _build_inverse_qft_circuit(num_qubits: int) -> QuantumCircuit:
+    """
+    Construct QFT† directly: the forward cascade mirrored, with negated angles.
+
+    Emits exactly the gates ``build_qft_circuit(n).inverse()`` would, without
+    building the forward circuit first and copying it.
+    """
+    qc = QuantumCircuit(num_qubits, name="QFT†")
+
+    for i in reversed(range(num_qubits // 2)):
+        qc.swap(i, num_qubits - 1 - i)
+
+    for j in reversed(range(num_qubits)):
+        for k in reversed(range(j + 1, num_qubits)):
+            qc.cp(-np.pi / (2 ** (k - j)), k, j)
+        qc.h(j)
 
     return qc
@@ -6,8 +6,10 @@ Usage:
     python test_api.py
 """
 
+import base64
 import requests
 import json
+import struct
 import sys
 
 BASE_URL = "http://localhost:8000"
@@ -109,6 +111,171 @@ def test_controlled_rotations():
     print()
 
 
+def test_statevector_only():
+    """Test statevector-only mode: shots=0 skips sampling, counts are empty."""
+    payload = {
+        "gates": [
+            {"name": "H", "qubits": [0]},
+            {"name": "CNOT", "qubits": [0, 1]},
+        ],
+        "num_qubits": 2,
+        "shots": 0,
+    }
+    resp = requests.post(f"{BASE_URL}/execute", json=payload)
+    print(f"[SV Only]     Status: {resp.status_code}")
+    data = resp.json()
+    print(f"  Counts: {data.get('counts')}")
+    assert resp.status_code == 200, "Statevector-only test failed!"
+    assert data["counts"] == {}, f"Expected empty counts, got {data['counts']}"
+    assert len(data["statevector"]) == 4, "Expected 4 amplitudes"
+    print()
+
+
+def test_statevector_binary():
+    """Test /execute/statevector.bin: Bell state as raw complex64 bytes."""
+    payload = {
+        "gates": [
+            {"name": "H", "qubits": [0]},
+            {"name": "CNOT", "qubits": [0, 1]},
+        ],
+        "num_qubits": 2,
+    }
+    resp = requests.post(f"{BASE_URL}/execute/statevector.bin", json=payload)
+    print(f"[SV Binary]   Status: {resp.status_code}")
+    print(f"  Bytes: {len(resp.content)}  Headers: {resp.headers.get('X-SV-Shape')}, "
+          f"{resp.headers.get('X-SV-Dtype')}")
+    assert resp.status_code == 200, "Statevector binary test failed!"
+    assert resp.headers["X-SV-Shape"] == "4"
+    assert resp.headers["X-SV-Dtype"] == "complex64"
+    # 4 amplitudes × (float32 real + float32 imag)
+    assert len(resp.content) == 4 * 8, f"Expected 32 bytes, got {len(resp.content)}"
+    floats = struct.unpack("<8f", resp.content)
+    expected = (0.70710677, 0.0, 0.0, 0.0, 0.0, 0.0, 0.70710677, 0.0)
+    assert all(abs(a - b) < 1e-5 for a, b in zip(floats, expected)), floats
+    print()
+
+
+def test_statevector_float32_b64():
+    """Test sv_encoding="float32_b64": Base64 float32 pairs on /execute."""
+    payload = {
+        "gates": [{"name": "X", "qubits": [1]}],
+        "num_qubits": 2,
+        "shots": 0,
+        "sv_encoding": "float32_b64",
+    }
+    resp = requests.post(f"{BASE_URL}/execute", json=payload)
+    print(f"[SV Base64]   Status: {resp.status_code}")
+    data = resp.json()
+    print(f"  Shape: {data.get('sv_shape')}  Dtype: {data.get('sv_dtype')}")
+    assert resp.status_code == 200, "float32_b64 test failed!"
+    assert data["statevector"] is None, "Expected no JSON statevector"
+    assert data["sv_shape"] == [4, 2] and data["sv_dtype"] == "float32"
+    raw = base64.b64decode(data["statevector_b64"])
+    assert len(raw) == 4 * 2 * 4, f"Expected 32 bytes, got {len(raw)}"
+    # X on qubit 1 → |10⟩ = basis index 2
+    assert struct.unpack("<8f", raw) == (0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0)
+    print()
+
+
+def test_sparse_counts():
+    """Test sparse_counts: histogram returned as integer key / value arrays."""
+    payload = {
+        "gates": [{"name": "X", "qubits": [0]}],
+        "num_qubits": 2,
+        "shots": 100,
+        "sparse_counts": True,
+    }
+    resp = requests.post(f"{BASE_URL}/execute", json=payload)
+    print(f"[Sparse]      Status: {resp.status_code}")
+    data = resp.json()
+    print(f"  Keys: {data.get('count_keys')}  Values: {data.get('count_values')}")
+    assert resp.status_code == 200, "Sparse counts test failed!"
+    assert data["counts"] == {}, f"Expected empty counts, got {data['counts']}"
+    # X(0) → classical bit 0 set → integer key 1
+    assert data["count_keys"] == [1] and data["count_values"] == [100]
+    print()
+
+
+def test_bloch_binary():
+    """Test /export/bloch.bin: concatenated PNGs split by X-Bloch-Lengths."""
+    payload = {
+        "gates": [{"name": "H", "qubits": [0]}],
+        "num_qubits": 2,
+    }
+    resp = requests.post(f"{BASE_URL}/export/bloch.bin", json=payload)
+    print(f"[Bloch Bin]   Status: {resp.status_code}")
+    lengths = [int(n) for n in resp.headers.get("X-Bloch-Lengths", "").split(",") if n]
+    print(f"  Bytes: {len(resp.content)}  Lengths: {lengths}")
+    assert resp.status_code == 200, "Bloch binary test failed!"
+    assert len(lengths) == 2, f"Expected one PNG per qubit, got {lengths}"
+    assert sum(lengths) == len(resp.content), "Lengths do not cover the body"
+    offset = 0
+    for n in lengths:
+        assert resp.content[offset:offset + 8] == b"\x89PNG\r\n\x1a\n", "Not a PNG"
+        offset += n
+    print()
+
+
+def test_bloch_with_statevector():
+    """Test /export/bloch?include_statevector=true: images plus statevector."""
+    payload = {
+        "gates": [{"name": "H", "qubits": [0]}],
+        "num_qubits": 2,
+    }
+    resp = requests.post(
+        f"{BASE_URL}/export/bloch", params={"include_statevector": "true"}, json=payload
+    )
+    print(f"[Bloch + SV]  Status: {resp.status_code}")
+    data = resp.json()
+    assert resp.status_code == 200, "Bloch with statevector test failed!"
+    images = [base64.b64decode(img) for img in data["bloch_images"]]
+    assert len(images) == 2, f"Expected one PNG per qubit, got {len(images)}"
+    assert all(png[:8] == b"\x89PNG\r\n\x1a\n" for png in images), "Not a PNG"
+    assert len(data["statevector"]) == 4, "Expected 4 amplitudes"
+    print()
+
+
+def test_bloch_vectors():
+    """Test simulation.bloch_vectors against Tr(ρ·σ) from partial_trace (in-process)."""
+    import numpy as np
+    from qiskit import QuantumCircuit
+    from qiskit.quantum_info import Pauli, Statevector, partial_trace
+
+    from simulation import bloch_vectors
+
+    # Qubits 0–1 partially entangled (mixed reduced states, |r| < 1);
+    # qubit 2 on the equator with a non-trivial phase
+    qc = QuantumCircuit(3)
+    qc.ry(1.1, 0)
+    qc.cx(0, 1)
+    qc.rx(0.4, 1)
+    qc.h(2)
+    qc.p(0.9, 2)
+    sv = Statevector(qc)
+
+    vectors = bloch_vectors(sv.data, 3)
+    print(f"[Bloch Vec]   {np.round(vectors, 4).tolist()}")
+    for q in range(3):
+        rho = partial_trace(sv, [i for i in range(3) if i != q])
+        expected = [rho.expectation_value(Pauli(p)).real for p in "XYZ"]
+        assert np.allclose(vectors[q], expected, atol=1e-9), (q, vectors[q], expected)
+    assert np.linalg.norm(vectors[0]) < 0.99, "Expected a mixed reduced state"
+    assert np.allclose(vectors[2], [np.cos(0.9), np.sin(0.9), 0.0])
+    print()
+
+
+def test_unknown_gate():
+    """Test that an unknown gate name is rejected with 422."""
+    payload = {
+        "gates": [{"name": "FOO", "qubits": [0]}],
+        "num_qubits": 1,
+    }
+    resp = requests.post(f"{BASE_URL}/execute", json=payload)
+    print(f"[Bad Gate]    Status: {resp.status_code}")
+    assert resp.status_code == 422, f"Expected 422, got {resp.status_code}"
+    print()
+
+
 def test_qft():
     """Test the QFT endpoint on 3 qubits with initial state |101⟩."""
     payload = {
@@ -128,6 +295,21 @@ def test_qft():
     print()
 
 
+def test_qft_inverse():
+    """Test /qft inverse=True: QFT†|101⟩ is the conjugate of QFT|101⟩."""
+    payload = {"num_qubits": 3, "initial_state": "101", "shots": 100}
+    forward = requests.post(f"{BASE_URL}/qft", json={**payload, "inverse": False})
+    inverse = requests.post(f"{BASE_URL}/qft", json={**payload, "inverse": True})
+    print(f"[QFT†]        Status: {inverse.status_code}")
+    assert forward.status_code == inverse.status_code == 200, "Inverse QFT test failed!"
+    fwd = [complex(re, im) for re, im in forward.json()["statevector"]]
+    inv = [complex(re, im) for re, im in inverse.json()["statevector"]]
+    # The QFT matrix F is symmetric, so column x of F† = F̄ᵀ is column x of F̄
+    assert all(abs(a - b.conjugate()) < 1e-5 for a, b in zip(inv, fwd)), (inv, fwd)
+    assert any(abs(a.imag) > 0.1 for a in fwd), "Expected complex amplitudes"
+    print()
+
+
 def test_optimize():
     """Test the optimisation endpoint with a simple circuit."""
     payload = {
@@ -146,6 +328,82 @@ def test_optimize():
     print()
 
 
+def test_optimize_skip():
+    """Test /optimize skipping: H·H cancels, unless skip_transpile is set."""
+    payload = {
+        "gates": [
+            {"name": "H", "qubits": [0]},
+            {"name": "H", "qubits": [0]},
+            {"name": "X", "qubits": [1]},
+        ],
+        "num_qubits": 2,
+    }
+    resp = requests.post(f"{BASE_URL}/optimize", json=payload)
+    print(f"[Opt Skip]    Status: {resp.status_code}")
+    data = resp.json()
+    assert resp.status_code == 200, "Optimize skip test failed!"
+    assert data["skipped"] is False, "Transpiler should have run"
+    assert data["optimized_ops"] == {"x": 1}, f"Got {data['optimized_ops']}"
+
+    # skip_transpile reports the circuit as-is
+    resp = requests.post(f"{BASE_URL}/optimize", json={**payload, "skip_transpile": True})
+    data = resp.json()
+    print(f"  skip_transpile: {data.get('improvement_msg', '')}")
+    assert resp.status_code == 200, "skip_transpile test failed!"
+    assert data["skipped"] is True
+    assert data["optimized_ops"] == data["original_ops"] == {"h": 2, "x": 1}
+    print()
+
+
+def test_qaoa_cache():
+    """Test /qaoa result caching: repeats are cached, force_rerun is not."""
+    payload = {
+        "num_qubits": 2,
+        "interaction_matrix": [[0, 1], [0, 0]],
+        "max_iter": 10,
+        "shots": 100,
+    }
+    resp = requests.post(f"{BASE_URL}/qaoa", json=payload)
+    print(f"[QAOA Cache]  Status: {resp.status_code}")
+    first = resp.json()
+    assert resp.status_code == 200, "QAOA test failed!"
+
+    # Repeat request is served from the result cache: identical run
+    cached = requests.post(f"{BASE_URL}/qaoa", json=payload).json()
+    assert cached["history"] == first["history"], "Expected a cached result"
+
+    # force_rerun re-optimises from a fresh random starting point
+    rerun = requests.post(f"{BASE_URL}/qaoa", json={**payload, "force_rerun": True}).json()
+    assert rerun["status"] == "completed"
+    assert rerun["history"] != first["history"], "Expected a fresh optimiser run"
+    print()
+
+
+def test_qaoa_codegen():
+    """Test /qaoa ?codegen= filtering and its 400 on an unknown framework."""
+    payload = {
+        "num_qubits": 2,
+        "interaction_matrix": [[0, 1], [0, 0]],
+        "max_iter": 10,
+        "shots": 100,
+    }
+    resp = requests.post(f"{BASE_URL}/qaoa", params={"codegen": "qiskit,qasm"}, json=payload)
+    print(f"[QAOA Code]   Status: {resp.status_code}")
+    data = resp.json()
+    print(f"  Code: {sorted(data.get('code') or {})}")
+    assert resp.status_code == 200, "QAOA codegen test failed!"
+    assert sorted(data["code"]) == ["qasm", "qiskit"], data["code"]
+
+    resp = requests.post(f"{BASE_URL}/qaoa", params={"codegen": "fortran"}, json=payload)
+    print(f"  Unknown codegen status: {resp.status_code}")
+    assert resp.status_code == 400, f"Expected 400, got {resp.status_code}"
+
+    # Without ?codegen= every framework is generated
+    data = requests.post(f"{BASE_URL}/qaoa", json=payload).json()
+    assert sorted(data["code"]) == ["cirq", "pennylane", "qasm", "qiskit", "qsharp"]
+    print()
+
+
 # ---------------------------------------------------------------------------
 # Runner
 # ---------------------------------------------------------------------------
@@ -162,8 +420,20 @@ if __name__ == "__main__":
         test_toffoli,
         test_swap,
         test_controlled_rotations,
+        test_statevector_only,
+        test_statevector_binary,
+        test_statevector_float32_b64,
+        test_sparse_counts,
+        test_bloch_binary,
+        test_bloch_with_statevector,
+        test_bloch_vectors,
+        test_unknown_gate,
         test_qft,
+        test_qft_inverse,
         test_optimize,
+        test_optimize_skip,
+        test_qaoa_cache,
+        test_qaoa_codegen,
     ]
 
     passed = 0
@@ -170,7 +170,9 @@ export const CircuitBoard: React.FC = () => {
           }
 
           for (const g of targets) {
-              if (g.name === 'M') {
+              if (g.name === '⊕') {
+                  continue; // CNOT target without a control
+              } else if (g.name === 'M') {
                   gates.push({ name: 'M', qubits: [g.qubit] });
               } else if (PARAMETERISED_GATES.has(g.name)) {
                   gates.push({
@@ -24,7 +24,12 @@ export interface QuantumGate {
 /** Result of a circuit execution (counts + optional statevector). */
 export interface ExecutionResult {
     counts: Record<string, number>;
+    count_keys?: number[];   // sparse_counts: basis states as integers
+    count_values?: number[]; // sparse_counts: counts, parallel to count_keys
     statevector?: number[][]; // [[real, imag], ...]
+    statevector_b64?: string; // sv_encoding "float32_b64": little-endian float32 pairs
+    sv_shape?: number[];      // [2**n, 2]
+    sv_dtype?: string;        // "float32"
     status: string;
     error?: string;
 }
@@ -37,6 +42,7 @@ export interface OptimizationResult {
     optimized_ops: Record<string, number>;
     optimized_qasm: string;
     improvement_msg: string;
+    skipped?: boolean;
     error?: string;
 }
 
@@ -193,15 +199,19 @@ export const exportToImage = async (
 
 /**
  * Request per-qubit Bloch sphere visualisations (Base64 PNGs).
+ * With `includeStatevector`, the statevector from the same simulation is
+ * returned alongside.
  */
 export const exportToBloch = async (
     gates: QuantumGate[],
     numQubits: number,
-): Promise<{ bloch_images?: string[]; image_base64?: string }> => {
-    const response = await axios.post(`${API_URL}/export/bloch`, {
-        gates,
-        num_qubits: numQubits,
-    });
+    includeStatevector = false,
+): Promise<{ bloch_images?: string[]; image_base64?: string; statevector?: number[][] }> => {
+    const response = await axios.post(
+        `${API_URL}/export/bloch`,
+        { gates, num_qubits: numQubits },
+        { params: includeStatevector ? { include_statevector: true } : undefined },
+    );
     return response.data;
 };
 